@@ -1,7 +1,7 @@
 # src/conduit_core/cli.py
 import typer
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TextIO, Union
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -183,24 +183,27 @@ def manifest(
 # ======================================================================================
 # COMMAND: conduit schema (enhanced)
 # ======================================================================================
-@app.command()
-def schema(
-    config_file: Path = typer.Option("ingest.yml", "--file", "-f"),
-    resource_name: str = typer.Argument(..., help="Resource name to infer schema from"),
-    output: Path = typer.Option("schema.json", "--output", "-o"),
-    sample_size: int = typer.Option(100, "--sample-size"),
-    format: str = typer.Option("json", "--format", help="Output format: json or yaml"),
-    verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed schema information"),
-):
-    """Infer and export schema from a source."""
-    import itertools, json, yaml
+def _schema_impl(
+    config_file: Path,
+    resource_name: str,
+    output: Union[Path, TextIO],
+    sample_size: int = 100,
+    format: str = "json",
+    verbose: bool = False,
+) -> int:
+    """
+    Infer and export a resource's schema. Returns the process exit code.
+
+    ``output`` is either a file path or an open text stream to write into.
+    """
+    import itertools
     from .schema import SchemaInferrer
 
     config = load_config(config_file)
     resource = next((r for r in config.resources if r.name == resource_name), None)
     if not resource:
         console.print(f"[red]Resource '{resource_name}' not found[/red]")
-        raise typer.Exit(1)
+        return 1
 
     src_config = next(s for s in config.sources if s.name == resource.source)
     src_class = get_source_connector_map()[src_config.type]
@@ -209,7 +212,7 @@ def schema(
     records = list(itertools.islice(source.read(resource.query), sample_size))
     if not records:
         console.print("[yellow][WARN] No records found[/yellow]")
-        raise typer.Exit(0)
+        return 0
 
     schema = SchemaInferrer.infer_schema(records, sample_size)
 
@@ -221,16 +224,40 @@ def schema(
             table.add_row(k, v["type"])
         console.print(table)
 
-    output.parent.mkdir(parents=True, exist_ok=True)
-    if format in ("yaml", "yml") or output.suffix in (".yaml", ".yml"):
+    if isinstance(output, Path):
+        as_yaml = format in ("yaml", "yml") or output.suffix in (".yaml", ".yml")
+        output.parent.mkdir(parents=True, exist_ok=True)
         with open(output, "w") as f:
-            yaml.dump(schema, f, sort_keys=False)
+            _dump_schema(schema, f, as_yaml)
+        target = output
     else:
-        with open(output, "w") as f:
-            json.dump(schema, f, indent=2)
+        _dump_schema(schema, output, format in ("yaml", "yml"))
+        target = getattr(output, "name", "stream")
 
-    console.print(f"[green][OK] Schema exported to {output}[/green]")
-    raise typer.Exit(code=0)
+    console.print(f"[green][OK] Schema exported to {target}[/green]")
+    return 0
+
+
+def _dump_schema(schema: dict, f: TextIO, as_yaml: bool) -> None:
+    import json, yaml
+
+    if as_yaml:
+        yaml.dump(schema, f, sort_keys=False)
+    else:
+        json.dump(schema, f, indent=2)
+
+
+@app.command()
+def schema(
+    config_file: Path = typer.Option("ingest.yml", "--file", "-f"),
+    resource_name: str = typer.Argument(..., help="Resource name to infer schema from"),
+    output: Path = typer.Option("schema.json", "--output", "-o"),
+    sample_size: int = typer.Option(100, "--sample-size"),
+    format: str = typer.Option("json", "--format", help="Output format: json or yaml"),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed schema information"),
+):
+    """Infer and export schema from a source."""
+    raise typer.Exit(code=_schema_impl(config_file, resource_name, output, sample_size, format, verbose))
 
 
 # ======================================================================================
@@ -1,27 +1,33 @@
 # src/conduit_core/connectors/__init__.py
 
-from .csv import CsvSource, CsvDestination
-from .dummy import DummySource, DummyDestination
-from .s3 import S3Source, S3Destination
-from .postgresql import PostgresSource, PostgresDestination
-from .snowflake import SnowflakeDestination
-from .parquet import ParquetSource, ParquetDestination
-from .json import JsonSource, JsonDestination
-from .bigquery import BigQueryDestination
+import importlib
 
-__all__ = [
-    'CsvSource',
-    'CsvDestination',
-    'DummySource', 
-    'DummyDestination',
-    'S3Source',
-    'S3Destination',
-    'PostgresSource',
-    'PostgresDestination',
-    'SnowflakeDestination',
-    'ParquetSource',
-    'ParquetDestination',
-    'JsonSource', 
-    'JsonDestination',
-    'BigQueryDestination',
-]
\ No newline at end of file
+# Connector classes are imported on first attribute access, so importing the
+# package (or the registry) does not pull in psycopg2, snowflake, bigquery, etc.
+_LAZY_EXPORTS = {
+    'CsvSource': '.csv',
+    'CsvDestination': '.csv',
+    'DummySource': '.dummy',
+    'DummyDestination': '.dummy',
+    'S3Source': '.s3',
+    'S3Destination': '.s3',
+    'PostgresSource': '.postgresql',
+    'PostgresDestination': '.postgresql',
+    'SnowflakeDestination': '.snowflake',
+    'ParquetSource': '.parquet',
+    'ParquetDestination': '.parquet',
+    'JsonSource': '.json',
+    'JsonDestination': '.json',
+    'BigQueryDestination': '.bigquery',
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
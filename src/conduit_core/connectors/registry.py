@@ -1,9 +1,11 @@
 # src/conduit_core/connectors/registry.py
+import ast
 import importlib
 import inspect
 import logging
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Dict, Type
+from typing import Dict, Iterator, Tuple, Type
 from .base import BaseSource, BaseDestination
 
 logger = logging.getLogger(__name__)
@@ -58,6 +60,80 @@ def discover_connectors() -> tuple[Dict[str, Type[BaseSource]], Dict[str, Type[B
     return source_map, destination_map
 
 
+def _index_connectors() -> tuple[Dict[str, Tuple[str, str]], Dict[str, Tuple[str, str]]]:
+    """
+    Finds connector classes by parsing the connector modules, without importing them.
+
+    Only classes that directly subclass BaseSource/BaseDestination are indexed.
+
+    Returns:
+        A tuple of (source_index, destination_index) mapping
+        {connector_type: (module_name, class_name)}
+    """
+    source_index = {}
+    destination_index = {}
+
+    connectors_dir = Path(__file__).parent
+
+    for file_path in sorted(connectors_dir.glob("*.py")):
+        if file_path.name.startswith("_") or file_path.name == "registry.py":
+            continue
+
+        module_name = file_path.stem
+
+        try:
+            tree = ast.parse(file_path.read_text(encoding="utf-8"))
+        except (OSError, SyntaxError) as e:
+            logger.warning(f"Failed to scan connector module '{module_name}': {e}")
+            continue
+
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            base_names = {
+                base.id if isinstance(base, ast.Name) else getattr(base, "attr", None)
+                for base in node.bases
+            }
+            if BaseSource.__name__ in base_names:
+                source_index[_derive_connector_type(node.name, "Source")] = (module_name, node.name)
+            elif BaseDestination.__name__ in base_names:
+                destination_index[_derive_connector_type(node.name, "Destination")] = (module_name, node.name)
+
+    return source_index, destination_index
+
+
+class _LazyConnectorMap(Mapping):
+    """
+    Read-only {connector_type: class} mapping that imports a connector module
+    on first lookup, so e.g. psycopg2 is only loaded when a Postgres connector is used.
+    """
+
+    def __init__(self, index: Dict[str, Tuple[str, str]]):
+        self._index = index
+        self._loaded: Dict[str, type] = {}
+
+    def __getitem__(self, connector_type: str) -> type:
+        if connector_type not in self._loaded:
+            module_name, class_name = self._index[connector_type]
+            try:
+                module = importlib.import_module(f".{module_name}", package="conduit_core.connectors")
+            except Exception as e:
+                logger.warning(f"Failed to import connector module '{module_name}': {e}")
+                raise KeyError(connector_type) from e
+            self._loaded[connector_type] = getattr(module, class_name)
+            logger.debug(f"Loaded connector: {connector_type} -> {class_name}")
+        return self._loaded[connector_type]
+
+    def __contains__(self, connector_type: object) -> bool:
+        return connector_type in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
 def _derive_connector_type(class_name: str, suffix: str) -> str:
     """
     Derives the connector type string from the class name.
@@ -89,27 +165,31 @@ def _derive_connector_type(class_name: str, suffix: str) -> str:
 _SOURCE_CONNECTOR_MAP = None
 _DESTINATION_CONNECTOR_MAP = None
 
-def get_source_connector_map() -> Dict[str, Type[BaseSource]]:
-    """Returns the discovered source connector map."""
+def get_source_connector_map() -> Mapping[str, Type[BaseSource]]:
+    """Returns the source connector map. Connector modules are imported on first lookup."""
     global _SOURCE_CONNECTOR_MAP
     if _SOURCE_CONNECTOR_MAP is None:
-        _SOURCE_CONNECTOR_MAP, _ = discover_connectors()
+        source_index, _ = _index_connectors()
 
         # Alias: allow both "postgres" and "postgresql"
-        if "postgres" in _SOURCE_CONNECTOR_MAP:
-            _SOURCE_CONNECTOR_MAP["postgresql"] = _SOURCE_CONNECTOR_MAP["postgres"]
+        if "postgres" in source_index:
+            source_index["postgresql"] = source_index["postgres"]
+
+        _SOURCE_CONNECTOR_MAP = _LazyConnectorMap(source_index)
 
     return _SOURCE_CONNECTOR_MAP
 
 
-def get_destination_connector_map() -> Dict[str, Type[BaseDestination]]:
-    """Returns the discovered destination connector map."""
+def get_destination_connector_map() -> Mapping[str, Type[BaseDestination]]:
+    """Returns the destination connector map. Connector modules are imported on first lookup."""
     global _DESTINATION_CONNECTOR_MAP
     if _DESTINATION_CONNECTOR_MAP is None:
-        _, _DESTINATION_CONNECTOR_MAP = discover_connectors()
+        _, destination_index = _index_connectors()
 
         # Alias: allow both "postgres" and "postgresql"
-        if "postgres" in _DESTINATION_CONNECTOR_MAP:
-            _DESTINATION_CONNECTOR_MAP["postgresql"] = _DESTINATION_CONNECTOR_MAP["postgres"]
+        if "postgres" in destination_index:
+            destination_index["postgresql"] = destination_index["postgres"]
+
+        _DESTINATION_CONNECTOR_MAP = _LazyConnectorMap(destination_index)
 
     return _DESTINATION_CONNECTOR_MAP
@@ -4,7 +4,7 @@ import logging
 import os
 import tempfile
 from pathlib import Path
-from typing import Iterable, Dict, Any
+from typing import Iterable, Dict, Any, BinaryIO, Callable, Optional
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 from dotenv import load_dotenv
@@ -128,7 +128,13 @@ class S3Source(BaseSource):
 class S3Destination(BaseDestination):
     """Skriver data til Amazon S3 bucket med atomic uploads."""
 
-    def __init__(self, config: DestinationConfig):
+    def __init__(self, config: DestinationConfig, _sink_factory: Optional[Callable[[], BinaryIO]] = None):
+        """
+        Args:
+            config: Destination config with 'bucket' and 'path' (S3 key).
+            _sink_factory: Test hook. When set, finalize() writes the serialized
+                file into the returned binary stream instead of uploading it.
+        """
         if not getattr(config, 'bucket', None):
             raise ValueError("S3Destination requires a 'bucket' parameter.")
         if not config.path:
@@ -137,6 +143,7 @@ class S3Destination(BaseDestination):
         self.bucket = config.bucket
         self.key = config.path
         self.accumulated_records = []
+        self._sink_factory = _sink_factory
         self.s3_client = _get_s3_client()
         logger.info(f"S3Destination initialized: s3://{self.bucket}/{self.key}")
 
@@ -173,7 +180,10 @@ class S3Destination(BaseDestination):
                 raise ValueError(f"Unsupported file type for S3Destination: {file_extension}")
             
             logger.info(f"Writing {len(self.accumulated_records)} records to S3")
-            self._upload_file(temp_path)
+            if self._sink_factory is not None:
+                self._sink_factory().write(Path(temp_path).read_bytes())
+            else:
+                self._upload_file(temp_path)
         finally:
             self.accumulated_records.clear()
             if os.path.exists(temp_path):
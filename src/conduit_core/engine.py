@@ -788,6 +788,7 @@ def run_resource(
                     if validator:
                         validation_result = validator.validate_batch(raw_batch_list)
                         valid_records_for_write = validation_result.valid_records
+                        dlq_failures = []
 
                         for invalid_result in validation_result.invalid_records:
                             try:
@@ -811,13 +812,16 @@ def run_resource(
                             failure_summary = "; ".join([f"{fc.column}({fc.check_name}): {fc.details or 'Failed'}" for fc in invalid_result.failed_checks])
 
                             if highest_action == QualityAction.FAIL:
+                                error_log.add_quality_errors(dlq_failures)
                                 logger.error(f"Record #{row_number or '?'} failed critical quality check. Halting pipeline.")
                                 raise DataQualityError(f"Record #{row_number or '?'} failed validation: {failure_summary}")
                             elif highest_action == QualityAction.WARN:
                                 logger.warning(f"Record #{row_number or '?'} failed quality check (Warn): {failure_summary}")
                             else:
                                 logger.debug(f"Record #{row_number or '?'} failed quality check (DLQ): {failure_summary}")
-                                error_log.add_quality_error(invalid_result.record, failure_summary, row_number=row_number)
+                                dlq_failures.append((invalid_result.record, failure_summary, row_number))
+
+                        error_log.add_quality_errors(dlq_failures)
 
                     # Enhanced quality analysis (AFTER the entire validator block)
                     if quality_analyzer and i == 0:  # First batch only
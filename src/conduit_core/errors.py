@@ -4,7 +4,7 @@ import json
 import logging
 from pathlib import Path
 from datetime import datetime, UTC # Use UTC for consistency
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -58,22 +58,46 @@ class ErrorLog:
         self.errors.append(error_entry)
         logger.debug(f"Row {row_number} failed (Processing Error): {type(error).__name__}: {error}") # Log debug, engine logs warning
 
-    # --- New Method for Quality Errors ---
-    def add_quality_error(self, record: Dict[str, Any], failed_checks: str, row_number: int = None):
-        """Adds a failed record due to quality checks (action='dlq')."""
-        error_entry = {
+    @staticmethod
+    def _quality_entry(record: Dict[str, Any], failed_checks: str, row_number: Optional[int], timestamp: str) -> Dict[str, Any]:
+        """Builds a DLQ entry for a record that failed quality checks."""
+        return {
             "row_number": row_number,
             "record": record,
             "error_type": "DataQualityError",
             "error_message": failed_checks, # Store the summary of failed checks
-            "timestamp": datetime.now(UTC).isoformat(), # Use UTC
+            "timestamp": timestamp,
             "failure_type": "quality_check"
         }
+
+    # --- New Method for Quality Errors ---
+    def add_quality_error(self, record: Dict[str, Any], failed_checks: str, row_number: int = None):
+        """Adds a failed record due to quality checks (action='dlq')."""
+        error_entry = self._quality_entry(record, failed_checks, row_number, datetime.now(UTC).isoformat()) # Use UTC
         self.quality_errors.append(error_entry)
         # Debug log here, the engine handles the warning/error level based on action
         logger.debug(f"Row {row_number} failed (Quality Check - DLQ): {failed_checks}")
     # --- End New Method ---
 
+    def add_quality_errors(self, items: Iterable[Tuple[Any, ...]]) -> int:
+        """
+        Adds a batch of quality-check failures in a single extend.
+
+        Each item is ``(record, failed_checks)`` or ``(record, failed_checks, row_number)``.
+        All entries in the batch share one timestamp.
+        Returns the number of entries added.
+        """
+        timestamp = datetime.now(UTC).isoformat() # Use UTC
+        before = len(self.quality_errors)
+        self.quality_errors.extend(
+            self._quality_entry(item[0], item[1], item[2] if len(item) > 2 else None, timestamp)
+            for item in items
+        )
+        added = len(self.quality_errors) - before
+        if added:
+            logger.debug(f"{added} rows failed (Quality Check - DLQ)")
+        return added
+
     def save(self) -> Path:
         """Saves all errors (processing and quality) to a JSON file."""
         all_errors = self.errors + self.quality_errors
@@ -2,7 +2,8 @@
 
 import logging
 import re
-from typing import Dict, Any, List, Optional, Callable, Set, Tuple
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Callable, Set, Tuple, Union
 from pydantic import BaseModel, field_validator, Field
 from enum import Enum
 
@@ -84,16 +85,22 @@ def not_null_validator(value: Any, **kwargs) -> bool:
     """Checks if a value is not None or an empty string."""
     return value is not None and value != ''
 
-def regex_validator(value: Any, pattern: Optional[str] = None, **kwargs) -> bool:
-    """Checks if a string value matches the regex pattern."""
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compiles a regex pattern once; repeat calls for the same pattern hit the cache."""
+    return re.compile(pattern)
+
+def regex_validator(value: Any, pattern: Optional[Union[str, re.Pattern]] = None, **kwargs) -> bool:
+    """Checks if a string value matches the regex pattern (a string or a precompiled re.Pattern)."""
     if not isinstance(value, str):
         return False # Regex only applies to strings
     if pattern is None:
          logger.warning("Regex check called without a 'pattern'.")
          return False # Cannot validate without pattern
     try:
-        # Use re.fullmatch for stricter matching (entire string must match)
-        return re.fullmatch(pattern, value) is not None
+        compiled = pattern if isinstance(pattern, re.Pattern) else _compile_pattern(pattern)
+        # Use fullmatch for stricter matching (entire string must match)
+        return compiled.fullmatch(value) is not None
     except re.error as e:
         logger.warning(f"Invalid regex pattern '{pattern}': {e}")
         return False # Pattern error means check fails
@@ -180,9 +187,11 @@ class QualityValidator:
     """Applies a list of QualityCheck rules to records."""
 
     def __init__(self, checks: List[QualityCheck]):
+        self.checks: List[QualityCheck] = [] # Valid checks, FAIL-action checks first
         self.checks_by_column: Dict[str, List[QualityCheck]] = {}
         # unique_sets stores state *during* a batch validation run
         self._unique_keys_config: List[Tuple[str, str]] = [] # Store (column, unique_key)
+        self._unique_key_by_column: Dict[str, str] = {} # column -> unique_key, resolved once here
 
         if not checks:
              logger.warning("QualityValidator initialized with no checks.")
@@ -194,6 +203,7 @@ class QualityValidator:
                  logger.warning(f"Skipping invalid QualityCheck with missing column or check name: {check}")
                  continue
 
+            self.checks.append(check)
             if check.column not in self.checks_by_column:
                 self.checks_by_column[check.column] = []
             self.checks_by_column[check.column].append(check)
@@ -203,6 +213,11 @@ class QualityValidator:
                 # Create a unique key for the state based on column and check name (e.g., 'user_id_unique')
                 unique_key = f"{check.column}_{check.check.lower()}"
                 self._unique_keys_config.append((check.column, unique_key))
+                self._unique_key_by_column[check.column] = unique_key
+
+        # Run FAIL-action checks first so validate_record can stop at the first one that fails.
+        # The sort is stable, so configured order is otherwise preserved.
+        self.checks.sort(key=lambda c: c.action != QualityAction.FAIL)
 
     def _run_check(self, check: QualityCheck, value: Any, current_batch_unique_sets: Dict[str, Set[Any]]) -> Tuple[bool, Optional[str]]:
         """Runs a single check and returns (is_valid, failure_detail)."""
@@ -219,9 +234,10 @@ class QualityValidator:
         try:
             # Handle unique check state explicitly using the batch-specific set
             if check.check.lower() == BuiltInCheck.UNIQUE.value:
-                unique_key = f"{check.column}_{check.check.lower()}"
-                seen_values = current_batch_unique_sets.get(unique_key)
-                if seen_values is None:
+                unique_key = self._unique_key_by_column[check.column]
+                try:
+                    seen_values = current_batch_unique_sets[unique_key] # Pre-created by new_batch_state()
+                except KeyError:
                      logger.error(f"Internal Error: Unique set not found for {unique_key} during batch validation.")
                      return (False, "Internal error: unique set missing")
 
@@ -258,6 +274,10 @@ class QualityValidator:
             logger.error(f"Error running check '{check.check}' on column '{check.column}' value '{value!r}': {e}", exc_info=False)
             return (False, f"Error during check execution: {e}")
 
+    def new_batch_state(self) -> Dict[str, Set[Any]]:
+        """Returns fresh, fully initialized state for the 'unique' checks of one batch."""
+        return {key: set() for _, key in self._unique_keys_config}
+
     def validate_record(self, record: Dict[str, Any], current_batch_unique_sets: Dict[str, Set[Any]]) -> ValidationResult:
         """
         Validates a single record against all applicable checks.
@@ -265,22 +285,21 @@ class QualityValidator:
         """
         failed_checks: List[ValidationFailure] = []
 
-        # Iterate through columns that have checks defined
-        for column, checks in self.checks_by_column.items():
-            value = record.get(column) # Use .get() to handle missing columns gracefully
-
-            for check in checks:
-                # Run the check, passing the state for unique sets
-                is_valid, details = self._run_check(check, value, current_batch_unique_sets)
-                if not is_valid:
-                    failed_checks.append(ValidationFailure(
-                        column=column,
-                        check_name=check.check,
-                        value=value, # Log the original value that failed
-                        details=details
-                    ))
-                    # Optional: Could break inner loop early if a check fails and action is 'fail'?
-                    # if check.action == QualityAction.FAIL: break
+        for check in self.checks:
+            value = record.get(check.column) # Use .get() to handle missing columns gracefully
+
+            # Run the check, passing the state for unique sets
+            is_valid, details = self._run_check(check, value, current_batch_unique_sets)
+            if not is_valid:
+                failed_checks.append(ValidationFailure(
+                    column=check.column,
+                    check_name=check.check,
+                    value=value, # Log the original value that failed
+                    details=details
+                ))
+                # A FAIL-action failure aborts the run, so the remaining checks are irrelevant
+                if check.action == QualityAction.FAIL:
+                    break
 
         return ValidationResult(
             is_valid=not bool(failed_checks), # Valid only if failed_checks list is empty
@@ -298,9 +317,7 @@ class QualityValidator:
 
         # Initialize unique check sets required for this batch based on config
         # This ensures state is reset for every batch
-        current_batch_unique_sets: Dict[str, Set[Any]] = {
-             key: set() for _, key in self._unique_keys_config
-        }
+        current_batch_unique_sets = self.new_batch_state()
 
         for record in records:
             # Pass the batch-specific state to validate_record
@@ -2,7 +2,8 @@
 
 import logging
 import re
-from typing import Dict, Any, List, Optional, Type
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Type
 from datetime import datetime, UTC
 from decimal import Decimal
 from collections import Counter
@@ -11,6 +12,10 @@ import csv
 
 logger = logging.getLogger(__name__)
 
+# String classification tables for SchemaInferrer._parse_string_type
+_BOOLEAN_STRINGS = frozenset({'true', 'false', 'yes', 'no', 't', 'f', 'y', 'n'})
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
 
 class ColumnDefinition(BaseModel):
     """A Pydantic model representing a single column's schema."""
@@ -43,25 +48,21 @@ class SchemaInferrer:
         # Sample records if we have too many
         sample = records[:sample_size] if len(records) > sample_size else records
         
-        # Get all column names, preserving order if possible (important for CSV header mapping)
-        all_columns = list()
-        seen_columns = set()
+        # One pass over the sample builds every column's non-null values.
+        # Dict insertion order keeps first-seen column order (important for
+        # CSV header mapping).
+        column_values: Dict[str, List[Any]] = {}
         for record in sample:
-             for key in record.keys():
-                  if key not in seen_columns:
-                       all_columns.append(key)
-                       seen_columns.add(key)
+            for column, value in record.items():
+                values = column_values.get(column)
+                if values is None:
+                    values = column_values[column] = []
+                if value is not None and value != '':
+                    values.append(value)
         
         column_definitions: List[Dict[str, Any]] = []
         
-        for column in all_columns:
-            # Collect all non-null values for this column
-            values = [
-                record.get(column) 
-                for record in sample 
-                if record.get(column) is not None and record.get(column) != ''
-            ]
-            
+        for column, values in column_values.items():
             if not values:
                 # All values are null
                 column_definitions.append({
@@ -95,10 +96,17 @@ class SchemaInferrer:
             Type name as string
         """
         type_votes = Counter()
+        string_counts = Counter()
         
         for value in values:
-            detected_type = SchemaInferrer._detect_value_type(value)
-            type_votes[detected_type] += 1
+            if isinstance(value, str):
+                string_counts[value] += 1
+            else:
+                type_votes[SchemaInferrer._detect_value_type(value)] += 1
+
+        # Parse each distinct string once; real columns repeat values heavily
+        for value, count in string_counts.items():
+            type_votes[SchemaInferrer._parse_string_type(value)] += count
         
         # Return the most common type
         # If there's a tie, prefer more specific types
@@ -156,12 +164,11 @@ class SchemaInferrer:
         if not value: # Treat empty string as potentially string
             return 'string'
 
-        # Check for boolean
-        if value.lower() in ('true', 'false', 'yes', 'no', 't', 'f', 'y', 'n', '1', '0'): # Added 1/0
-             # Only return boolean if it's ONLY boolean values being seen
-             # Needs context from _infer_column_type, for now, be specific
-            if value.lower() in ('true', 'false', 'yes', 'no', 't', 'f', 'y', 'n'):
-                 return 'boolean'
+        lowered = value.lower()
+
+        # Check for boolean ('1'/'0' are left to the integer check)
+        if lowered in _BOOLEAN_STRINGS:
+            return 'boolean'
 
         # Check for integer
         if value.isdigit() or (value.startswith('-') and value[1:].isdigit()):
@@ -172,7 +179,7 @@ class SchemaInferrer:
                   pass # Might be too large for standard int, could be float/string
 
         # Check for float/decimal
-        if '.' in value or 'e' in value.lower():
+        if '.' in value or 'e' in lowered:
              try:
                   float(value) # Use float for broad check
                   # Could refine later to check for decimal precision if needed
@@ -181,7 +188,7 @@ class SchemaInferrer:
                   pass
         
         # Check for date FIRST (YYYY-MM-DD) - more specific
-        if len(value) == 10 and value.count('-') == 2:
+        if _ISO_DATE_RE.fullmatch(value):
             try:
                 datetime.strptime(value, '%Y-%m-%d')
                 return 'date'
@@ -241,6 +248,19 @@ class CsvDelimiterDetector:
             logger.warning("Empty file, defaulting to comma delimiter")
             return ','
         
+        # Fast path: exactly one candidate appears the same non-zero number of
+        # times on every sampled line. str.count runs in C, so this avoids
+        # csv.Sniffer's regex lexing for the common, unambiguous case.
+        lines = [line for line in sample if line.strip()]
+        if len(lines) > 1:
+            consistent = [
+                delim for delim in CsvDelimiterDetector.COMMON_DELIMITERS
+                if len({line.count(delim) for line in lines}) == 1 and lines[0].count(delim) > 0
+            ]
+            if len(consistent) == 1:
+                logger.info(f"Detected delimiter via line counts: '{consistent[0]}'")
+                return consistent[0]
+
         # Use csv.Sniffer
         try:
             sniffer = csv.Sniffer()
@@ -312,6 +332,84 @@ class CsvDelimiterDetector:
         return best_delimiter
 
 
+# Logical type -> SQL type, per dialect. Built once at import and read-only,
+# so TableAutoCreator lookups don't rebuild a dict per call.
+_DIALECT_TYPE_MAPPINGS: Dict[str, Mapping[str, str]] = {
+    "postgresql": MappingProxyType({
+        'integer': 'INTEGER',
+        'float': 'DOUBLE PRECISION',
+        'decimal': 'NUMERIC',
+        'boolean': 'BOOLEAN',
+        'date': 'DATE',
+        'datetime': 'TIMESTAMP',
+        'string': 'TEXT',
+        'json': 'JSONB'
+    }),
+    "snowflake": MappingProxyType({
+        'integer': 'NUMBER(38,0)',
+        'float': 'FLOAT',
+        'decimal': 'NUMBER(38,9)', # Default precision
+        'boolean': 'BOOLEAN',
+        'date': 'DATE',
+        'datetime': 'TIMESTAMP_NTZ', # Non-timezone aware is common
+        'string': 'VARCHAR',
+        'json': 'VARIANT'
+    }),
+    "bigquery": MappingProxyType({
+        'integer': 'INT64',
+        'float': 'FLOAT64',
+        'decimal': 'NUMERIC', # Standard precision NUMERIC
+        'boolean': 'BOOL',
+        'date': 'DATE',
+        'datetime': 'DATETIME',
+        'string': 'STRING',
+        'json': 'JSON'
+    }),
+    "mysql": MappingProxyType({
+        'integer': 'INT',
+        'float': 'DOUBLE',
+        'decimal': 'DECIMAL(18,2)', # Example precision
+        'boolean': 'BOOLEAN', # Or TINYINT(1)
+        'date': 'DATE',
+        'datetime': 'DATETIME',
+        'string': 'TEXT',
+        'json': 'JSON'
+    }),
+    "sqlite": MappingProxyType({
+        'integer': 'INTEGER',
+        'float': 'REAL',
+        'decimal': 'REAL', # SQLite uses REAL for decimals too
+        'boolean': 'INTEGER', # Booleans stored as 0 or 1
+        'date': 'TEXT', # Store dates as ISO8601 strings
+        'datetime': 'TEXT', # Store datetimes as ISO8601 strings
+        'string': 'TEXT',
+        'json': 'TEXT' # Store JSON as text
+    }),
+}
+_DIALECT_TYPE_MAPPINGS["mssql"] = _DIALECT_TYPE_MAPPINGS["azuresql"] = MappingProxyType({
+    'integer': 'INT',
+    'float': 'FLOAT',
+    'decimal': 'DECIMAL(18,2)',
+    'boolean': 'BIT',
+    'date': 'DATE',
+    'datetime': 'DATETIME2',
+    'string': 'NVARCHAR(MAX)',
+    'json': 'NVARCHAR(MAX)' # Often stored as text
+})
+
+# Default generic mapping (ANSI SQL like) for unknown dialects
+_DEFAULT_TYPE_MAPPING: Mapping[str, str] = MappingProxyType({
+    'integer': 'INTEGER',
+    'float': 'FLOAT',
+    'decimal': 'DECIMAL',
+    'boolean': 'BOOLEAN',
+    'date': 'DATE',
+    'datetime': 'TIMESTAMP',
+    'string': 'VARCHAR(255)',
+    'json': 'VARCHAR(8000)' # Example length
+})
+
+
 class TableAutoCreator:
     """Automatically creates destination tables based on inferred schema"""
     
@@ -333,44 +431,31 @@ class TableAutoCreator:
             CREATE TABLE SQL statement
         """
         type_mapping = TableAutoCreator._get_type_mapping(dialect)
+        # BigQuery quotes identifiers with backticks; everything else uses
+        # standard SQL double quotes
+        quote = '`' if dialect == "bigquery" else '"'
         
         column_defs = []
         for column_info_dict in schema.get('columns', []):
             try:
-                # Ensure we handle potential extra fields gracefully if using ColumnDefinition directly
-                col_data = {k: v for k, v in column_info_dict.items() if k in ColumnDefinition.model_fields}
-                col = ColumnDefinition(**col_data)
-                
-                # Map to SQL type
-                sql_type = type_mapping.get(col.type, 'VARCHAR(255)') # Default type if mapping missing
-                
-                # Build column definition
-                null_clause = '' if col.nullable else ' NOT NULL'
-                
-                # Handle dialect-specific quoting
-                if dialect == "bigquery":
-                    # BigQuery doesn't quote standard identifiers unless needed
-                    column_def = f'`{col.name}` {sql_type}{null_clause}'
-                else:
-                    # Use standard SQL double quotes
-                    column_def = f'"{col.name}" {sql_type}{null_clause}'
-                
-                column_defs.append(column_def)
+                # ColumnDefinition ignores extra fields, so the raw dict is passed as-is
+                col = ColumnDefinition(**column_info_dict)
             except Exception as e:
                 logger.error(f"Failed to parse column info: {column_info_dict}. Error: {e}")
+                continue
+            # Default type if mapping missing
+            sql_type = type_mapping.get(col.type, 'VARCHAR(255)')
+            null_clause = '' if col.nullable else ' NOT NULL'
+            column_defs.append(f'  {quote}{col.name}{quote} {sql_type}{null_clause}')
 
         if not column_defs:
             raise ValueError("Schema contains no columns to create.")
 
-        # Dialect-specific CREATE TABLE
-        # Use standard quoting for table name as well, unless BigQuery
-        quoted_table_name = f"`{table_name}`" if dialect == "bigquery" else f'"{table_name}"'
-        sql = f'CREATE TABLE IF NOT EXISTS {quoted_table_name} (\n'
-
-        sql += ',\n'.join(f'  {col}' for col in column_defs)
-        sql += '\n);'
-        
-        return sql
+        return (
+            f'CREATE TABLE IF NOT EXISTS {quote}{table_name}{quote} (\n'
+            + ',\n'.join(column_defs)
+            + '\n);'
+        )
 
     @staticmethod
     def generate_add_column_sql(
@@ -409,87 +494,9 @@ class TableAutoCreator:
 
 
     @staticmethod
-    def _get_type_mapping(dialect: str) -> Dict[str, str]:
+    def _get_type_mapping(dialect: str) -> Mapping[str, str]:
         """Get type mapping for SQL dialect"""
-        if dialect == "postgresql":
-            return {
-                'integer': 'INTEGER',
-                'float': 'DOUBLE PRECISION',
-                'decimal': 'NUMERIC',
-                'boolean': 'BOOLEAN',
-                'date': 'DATE',
-                'datetime': 'TIMESTAMP',
-                'string': 'TEXT',
-                'json': 'JSONB'
-            }
-        elif dialect == "snowflake":
-            return {
-                'integer': 'NUMBER(38,0)',
-                'float': 'FLOAT',
-                'decimal': 'NUMBER(38,9)', # Default precision
-                'boolean': 'BOOLEAN',
-                'date': 'DATE',
-                'datetime': 'TIMESTAMP_NTZ', # Non-timezone aware is common
-                'string': 'VARCHAR',
-                'json': 'VARIANT'
-            }
-        elif dialect == "bigquery":
-            return {
-                'integer': 'INT64',
-                'float': 'FLOAT64',
-                'decimal': 'NUMERIC', # Standard precision NUMERIC
-                'boolean': 'BOOL',
-                'date': 'DATE',
-                'datetime': 'DATETIME',
-                'string': 'STRING',
-                'json': 'JSON'
-            }
-        elif dialect == "mysql":
-            return {
-                'integer': 'INT',
-                'float': 'DOUBLE',
-                'decimal': 'DECIMAL(18,2)', # Example precision
-                'boolean': 'BOOLEAN', # Or TINYINT(1)
-                'date': 'DATE',
-                'datetime': 'DATETIME',
-                'string': 'TEXT',
-                'json': 'JSON'
-            }
-        elif dialect == "sqlite":
-            # *** FIX was applied here previously ***
-            return {
-                'integer': 'INTEGER',
-                'float': 'REAL',
-                'decimal': 'REAL', # SQLite uses REAL for decimals too
-                'boolean': 'INTEGER', # Booleans stored as 0 or 1
-                'date': 'TEXT', # Store dates as ISO8601 strings
-                'datetime': 'TEXT', # Store datetimes as ISO8601 strings
-                'string': 'TEXT',
-                'json': 'TEXT' # Store JSON as text
-            }
-        elif dialect in ("mssql", "azuresql"):
-             return {
-                 'integer': 'INT',
-                 'float': 'FLOAT',
-                 'decimal': 'DECIMAL(18,2)',
-                 'boolean': 'BIT',
-                 'date': 'DATE',
-                 'datetime': 'DATETIME2',
-                 'string': 'NVARCHAR(MAX)',
-                 'json': 'NVARCHAR(MAX)' # Often stored as text
-             }
-        else:
-            # Default generic mapping (ANSI SQL like)
-            return {
-                'integer': 'INTEGER',
-                'float': 'FLOAT',
-                'decimal': 'DECIMAL',
-                'boolean': 'BOOLEAN',
-                'date': 'DATE',
-                'datetime': 'TIMESTAMP',
-                'string': 'VARCHAR(255)',
-                'json': 'VARCHAR(8000)' # Example length
-            }
+        return _DIALECT_TYPE_MAPPINGS.get(dialect, _DEFAULT_TYPE_MAPPING)
 
 
 def compare_schemas(source_schema: dict, dest_schema: dict) -> dict:
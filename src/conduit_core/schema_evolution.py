@@ -1,12 +1,16 @@
 # src/conduit_core/schema_evolution.py
 
 import logging
-from typing import List, Optional, Dict, Any, Set
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Dict, Any, Set
 from pydantic import BaseModel
 from .schema import ColumnDefinition
 from .connectors.base import BaseDestination
 from .config import SchemaEvolutionConfig
 
+if TYPE_CHECKING:
+    from .schema_store import AuditRef
+
 logger = logging.getLogger(__name__)
 
 class TypeChange(BaseModel):
@@ -40,6 +44,11 @@ class SchemaChanges(BaseModel):
 class SchemaEvolutionManager:
     """Detects and handles schema changes between a new and old schema."""
 
+    def __init__(self):
+        # Audit file written by the most recent apply_evolution call, if any
+        self.last_audit_path: Optional[Path] = None
+        self.last_audit_ref: Optional["AuditRef"] = None
+
     @staticmethod
     def compare_schemas(old_schema: Dict[str, Any], new_schema: Dict[str, Any]) -> SchemaChanges:
         """
@@ -49,37 +58,32 @@ class SchemaEvolutionManager:
             old_schema: The schema currently in the destination (e.g., from DB).
             new_schema: The schema inferred from the source data.
         """
-        old_cols: Dict[str, ColumnDefinition] = {
-            col['name'].lower(): ColumnDefinition(**col) for col in old_schema.get('columns', [])
+        # Raw column dicts keyed by lowercased name; ColumnDefinition models are
+        # only built for columns that actually appear in the result.
+        old_cols: Dict[str, Dict[str, Any]] = {
+            col['name'].lower(): col for col in old_schema.get('columns', [])
         }
-        new_cols: Dict[str, ColumnDefinition] = {
-            col['name'].lower(): ColumnDefinition(**col) for col in new_schema.get('columns', [])
+        new_cols: Dict[str, Dict[str, Any]] = {
+            col['name'].lower(): col for col in new_schema.get('columns', [])
         }
 
-        old_col_names = set(old_cols.keys())
-        new_col_names = set(new_cols.keys())
-
-        added_col_names = new_col_names - old_col_names
-        removed_col_names = old_col_names - new_col_names
-        common_col_names = new_col_names.intersection(old_col_names)
-
         changes = SchemaChanges()
 
-        for col_name in added_col_names:
-            changes.added_columns.append(new_cols[col_name])
-
-        for col_name in removed_col_names:
-            changes.removed_columns.append(old_cols[col_name])
+        # Dict membership keeps schema order (set differences would not)
+        changes.added_columns = [
+            ColumnDefinition(**col) for name, col in new_cols.items() if name not in old_cols
+        ]
+        changes.removed_columns = [
+            ColumnDefinition(**col) for name, col in old_cols.items() if name not in new_cols
+        ]
 
-        for col_name in common_col_names:
-            old_col = old_cols[col_name]
-            new_col = new_cols[col_name]
-            
+        for col_name, new_col in new_cols.items():
+            old_col = old_cols.get(col_name)
             # Simple type comparison for now.
             # TODO: Add more sophisticated type compatibility logic
-            if old_col.type != new_col.type:
+            if old_col is not None and old_col['type'] != new_col['type']:
                 changes.type_changes.append(
-                    TypeChange(column=col_name, old_type=old_col.type, new_type=new_col.type)
+                    TypeChange(column=col_name, old_type=old_col['type'], new_type=new_col['type'])
                 )
         
         return changes
@@ -135,7 +139,14 @@ class SchemaEvolutionManager:
         config: SchemaEvolutionConfig,
         resource_name: str
     ) -> List[str]:
-        """Apply evolution based on config policy. Returns list of executed DDL."""
+        """
+        Apply evolution based on config policy. Returns list of executed DDL.
+
+        When an audit event is written, the audit log's path is kept on
+        ``last_audit_path`` and the event's location in it on ``last_audit_ref``.
+        """
+        self.last_audit_path = None
+        self.last_audit_ref = None
 
         if not changes.has_changes():
             logger.info("No schema changes detected.")
@@ -220,6 +231,9 @@ class SchemaEvolutionManager:
                 new_version=new_version
             )
 
+            self.last_audit_path = audit_file
+            self.last_audit_ref = schema_store.last_audit_ref
+
             print(f"  Version: {old_version} → {new_version}")
             print(f"  Audit: {audit_file}")
 
@@ -1,17 +1,128 @@
+import copy
 import hashlib
 import json
 import logging
+import os
+import sys
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, UTC
 
 logger = logging.getLogger(__name__)
 
+# orjson is optional; it parses/serializes several times faster than json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _read_json(path: Path) -> Any:
+    """Load a JSON file. Decode errors are json.JSONDecodeError either way."""
+    if HAS_ORJSON:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize data as indented JSON. Unserializable values raise TypeError either way."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode()
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """
+    Write data as indented JSON to a temp file beside path, then rename it over path.
+
+    Readers see either the old file or the complete new one, never a partial write.
+    """
+    payload = _dumps(data)
+    temp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def _intern_columns(record: Any) -> None:
+    """Intern column names and types of a loaded schema record in place."""
+    schema = record.get('schema') if isinstance(record, dict) else None
+    columns = schema.get('columns') if isinstance(schema, dict) else None
+    if not isinstance(columns, list):
+        return
+    for col in columns:
+        if not isinstance(col, dict):
+            continue
+        for field in ('name', 'type'):
+            value = col.get(field)
+            if type(value) is str:
+                col[field] = sys.intern(value)
+
+
+def _hash_update(h: Any, value: Any) -> None:
+    """Feed value into h field by field, walking dict keys in sorted order."""
+    if isinstance(value, dict):
+        h.update(b'{%d' % len(value))
+        for key in sorted(value):
+            _hash_update(h, key)
+            _hash_update(h, value[key])
+    elif isinstance(value, (list, tuple)):
+        h.update(b'[%d' % len(value))
+        for item in value:
+            _hash_update(h, item)
+    elif isinstance(value, str):
+        encoded = value.encode()
+        h.update(b's%d:' % len(encoded))
+        h.update(encoded)
+    elif value is None or isinstance(value, bool):
+        h.update(b'n' if value is None else b'\x01' if value else b'\x00')
+    else:
+        h.update(b'r%s;' % repr(value).encode())
+
 
 def compute_schema_hash(schema: Dict[str, Any]) -> str:
-    sorted_cols = sorted(schema.get('columns', []), key=lambda x: x['name'])
-    schema_str = json.dumps(sorted_cols, sort_keys=True)
-    return hashlib.sha256(schema_str.encode()).hexdigest()[:16]
+    """16-char structural hash of a schema's columns, independent of column order."""
+    h = hashlib.blake2b(digest_size=8)
+    _hash_update(h, sorted(schema.get('columns', []), key=lambda x: x['name']))
+    return h.hexdigest()
+
+
+AUDIT_LOG_NAME = "audit.log.ndjson"
+
+# absolute latest-file path -> ((ino, mtime_ns, size), parsed contents). Module-level so
+# the many short-lived SchemaStore instances the engine creates share it.
+_LAST_SCHEMA_CACHE: Dict[str, Tuple[Tuple[int, int, int], Dict[str, Any]]] = {}
+
+
+@dataclass(frozen=True)
+class AuditRef:
+    """Location of one event line inside the append-only audit log."""
+    path: Path
+    offset: int
+    length: int
+
+    def exists(self) -> bool:
+        try:
+            return self.path.stat().st_size >= self.offset + self.length
+        except OSError:
+            return False
+
+    def load(self) -> Dict[str, Any]:
+        """Read back just this event's line."""
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            data = f.read(self.length)
+        return orjson.loads(data) if HAS_ORJSON else json.loads(data)
 
 
 class SchemaStore:
@@ -29,6 +140,8 @@ class SchemaStore:
         self.schema_dir.mkdir(parents=True, exist_ok=True)
         self.audit_dir = self.base_dir / "schema_audit"
         self.audit_dir.mkdir(parents=True, exist_ok=True)
+        # Where the most recent log_evolution_event line landed in the audit log
+        self.last_audit_ref: Optional[AuditRef] = None
 
     def _get_latest_path(self, resource_name: str) -> Path:
         return self.schema_dir / f"{resource_name}_latest.json"
@@ -37,17 +150,18 @@ class SchemaStore:
         return self.schema_dir / resource_name
 
     def save_schema(self, resource_name: str, schema: Dict[str, Any]) -> int:
-        version = self._get_next_version(resource_name)
+        """Saves a new schema version, archiving the previous one."""
+        latest_path = self._get_latest_path(resource_name)
+        latest = self.load_last_schema(resource_name)
+        version = latest.get('version', 0) + 1 if latest else 1
         schema_hash = compute_schema_hash(schema)
         
-        latest_path = self._get_latest_path(resource_name)
         history_dir = self._get_history_dir(resource_name)
         history_dir.mkdir(parents=True, exist_ok=True)
         
         if latest_path.exists():
             try:
-                with open(latest_path, 'r') as f:
-                    old_schema_data = json.load(f)
+                old_schema_data = _read_json(latest_path)
                 
                 timestamp_str = old_schema_data.get(
                     'timestamp', 
@@ -70,8 +184,7 @@ class SchemaStore:
                 'hash': schema_hash,
                 'version': version
             }
-            with open(latest_path, 'w') as f:
-                json.dump(schema_to_save, f, indent=2)
+            _write_json(latest_path, schema_to_save)
             logger.debug(f"Saved new schema for '{resource_name}' to {latest_path}")
         except (IOError, TypeError) as e:
             logger.error(f"Failed to save new schema to {latest_path}: {e}")
@@ -80,16 +193,33 @@ class SchemaStore:
         return version
 
     def load_last_schema(self, resource_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Load the latest stored schema version for a resource.
+
+        Parsed files are cached until the file's inode, mtime or size changes; each
+        call returns its own copy, so callers may mutate the result freely.
+        """
         latest_path = self._get_latest_path(resource_name)
+        cache_key = os.path.abspath(latest_path)
         
-        if not latest_path.exists():
+        try:
+            st = latest_path.stat()
+        except OSError:
+            _LAST_SCHEMA_CACHE.pop(cache_key, None)
             logger.debug(f"No previous schema found for '{resource_name}' at {latest_path}")
             return None
         
+        stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = _LAST_SCHEMA_CACHE.get(cache_key)
+        if cached and cached[0] == stamp:
+            return copy.deepcopy(cached[1])
+        
         try:
-            with open(latest_path, 'r') as f:
-                schema_data = json.load(f)
-            return schema_data
+            data = _read_json(latest_path)
+            # Column names and types repeat across resources; share one string object each
+            _intern_columns(data)
+            _LAST_SCHEMA_CACHE[cache_key] = (stamp, data)
+            return copy.deepcopy(data)
         except (json.JSONDecodeError, IOError) as e:
             logger.error(f"Failed to load last schema from {latest_path}: {e}")
             return None
@@ -109,8 +239,7 @@ class SchemaStore:
             history = []
             for file_path in history_files[:limit]:
                 try:
-                    with open(file_path, 'r') as f:
-                        history.append(json.load(f))
+                    history.append(_read_json(file_path))
                 except (json.JSONDecodeError, IOError):
                     logger.warning(f"Could not read schema history file: {file_path}")
             
@@ -127,7 +256,12 @@ class SchemaStore:
         old_version: int,
         new_version: int
     ) -> Path:
-        timestamp = datetime.now(UTC).strftime('%Y%m%d_%H%M%S')
+        """
+        Append an evolution event to the audit log and return the log's path.
+
+        Events are stored one JSON object per line in ``audit.log.ndjson``;
+        the new line's offset and length are kept on ``last_audit_ref``.
+        """
         audit_entry = {
             'timestamp': datetime.now(UTC).isoformat(),
             'resource': resource_name,
@@ -136,11 +270,18 @@ class SchemaStore:
             'changes': changes,
             'ddl_executed': ddl_applied
         }
+        if HAS_ORJSON:
+            line = orjson.dumps(audit_entry, option=orjson.OPT_APPEND_NEWLINE)
+        else:
+            line = json.dumps(audit_entry, separators=(',', ':')).encode() + b'\n'
         
-        audit_file = self.audit_dir / f"{resource_name}_{timestamp}.json"
-        with open(audit_file, 'w') as f:
-            json.dump(audit_entry, f, indent=2)
+        audit_file = self.audit_dir / AUDIT_LOG_NAME
+        # Unbuffered append: the line goes out in one write, and tell() is the log's end
+        with open(audit_file, 'ab', buffering=0) as f:
+            offset = f.tell()
+            f.write(line)
         
+        self.last_audit_ref = AuditRef(audit_file, offset, len(line))
         return audit_file
 
     def _get_next_version(self, resource_name: str) -> int:
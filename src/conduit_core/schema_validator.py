@@ -1,6 +1,7 @@
 # src/conduit_core/schema_validator.py
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel
+import io
 import logging
 
 logger = logging.getLogger(__name__)
@@ -36,17 +37,29 @@ class ValidationReport(BaseModel):
     def has_warnings(self) -> bool:
         return len(self.warnings) > 0
 
+    @staticmethod
+    def _format_lines(items: List[ValidationError]) -> str:
+        """One formatted line per item, written straight into a buffer."""
+        buf = io.StringIO()
+        write = buf.write
+        it = iter(items)
+        write(next(it).format())
+        for item in it:
+            write("\n")
+            write(item.format())
+        return buf.getvalue()
+
     def format_errors(self) -> str:
         """Format all errors as multi-line string"""
         if not self.errors:
             return "No errors."
-        return "\n".join(e.format() for e in self.errors)
+        return self._format_lines(self.errors)
 
     def format_warnings(self) -> str:
         """Format all warnings as multi-line string"""
         if not self.warnings:
             return "No warnings."
-        return "\n".join(w.format() for w in self.warnings)
+        return self._format_lines(self.warnings)
 
 
 class SchemaValidator:
@@ -62,9 +75,18 @@ class SchemaValidator:
         'datetime': ['datetime', 'string'],
     }
 
+    # (source_type, dest_type) pairs from TYPE_COMPATIBILITY, for one hash probe per column
+    _COMPATIBLE = frozenset(
+        (source_type, dest_type)
+        for source_type, dest_types in TYPE_COMPATIBILITY.items()
+        for dest_type in dest_types
+    )
+
+    # Types compatible with themselves, for the identical-schema fast path
+    _SELF_COMPATIBLE = frozenset(source for source, dest in _COMPATIBLE if source == dest)
+
     def _is_compatible_type(self, source_type: str, dest_type: str) -> bool:
-        compatible = self.TYPE_COMPATIBILITY.get(source_type, [])
-        return dest_type in compatible
+        return (source_type, dest_type) in self._COMPATIBLE
 
     def validate_type_compatibility(
         self,
@@ -77,6 +99,14 @@ class SchemaValidator:
             source_schema: {column: {type, nullable}}
             dest_schema: {column: {type, nullable}}
         """
+        # Identical schemas: nothing can be missing or mismatched, provided
+        # every type is one TYPE_COMPATIBILITY knows (unknown types never match)
+        if source_schema is dest_schema or (
+            len(source_schema) == len(dest_schema) and source_schema == dest_schema
+        ):
+            if self._SELF_COMPATIBLE.issuperset(info.get("type") for info in dest_schema.values()):
+                return ValidationReport(is_valid=True)
+
         errors: List[ValidationError] = []
         warnings: List[ValidationError] = []
 
@@ -130,8 +160,13 @@ class SchemaValidator:
         errors: List[ValidationError] = []
         warnings: List[ValidationError] = []
 
+        # Set difference runs in C; the common no-missing case ends here
+        missing = dest_schema.keys() - source_schema.keys()
+        if not missing:
+            return ValidationReport(is_valid=True, errors=errors, warnings=warnings)
+
         for col_name in dest_schema.keys():
-            if col_name not in source_schema:
+            if col_name in missing:
                 err = ValidationError(
                     column=col_name,
                     issue="missing_column",
@@ -150,7 +185,11 @@ class SchemaValidator:
         required_columns: List[str],
     ) -> List[str]:
         """Ensure source has all required columns."""
-        return [c for c in required_columns if c not in source_schema]
+        missing = set(required_columns) - source_schema.keys()
+        if not missing:
+            return []
+        # Keep the caller's order in the result
+        return [c for c in required_columns if c in missing]
 
     def validate_constraints(
         self,
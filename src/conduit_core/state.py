@@ -1,11 +1,15 @@
 # src/conduit_core/state.py
 
+import copy
 import json
 import logging
+import mmap
 import os
+import shutil
 import sys
+import threading
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 
 # Platform-specific imports for file locking
 if sys.platform != 'win32':
@@ -14,37 +18,94 @@ else:
     # Windows doesn't have fcntl, we'll use a simpler approach
     import msvcrt
 
+# orjson is optional; it parses/serializes several times faster than json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
 STATE_FILE = Path(".conduit_state.json")
 BACKUP_FILE = Path(".conduit_state.backup.json")
 LOCK_FILE = Path(".conduit_state.lock")
 
+# Last state read or written: (state file path, (inode, mtime_ns, size) on disk, state).
+# save_state always swaps in a new inode, so a rewrite is detected even within one mtime tick.
+_STATE_CACHE: Optional[Tuple[Path, Tuple[int, int, int], Dict[str, Any]]] = None
+_CACHE_LOCK = threading.Lock()
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _cache_state(state: Dict[str, Any], stamp: Optional[Tuple[int, int, int]]) -> None:
+    global _STATE_CACHE
+    with _CACHE_LOCK:
+        _STATE_CACHE = (STATE_FILE, stamp, copy.deepcopy(state)) if stamp else None
+
+
+def _read_state_file(path: Path) -> Any:
+    """Parse a state file. Decode errors are json.JSONDecodeError either way."""
+    if not HAS_ORJSON:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return orjson.loads(b'')  # mmap can't map an empty file; raises JSONDecodeError
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+def _dump_state(state: Dict[str, Any]) -> bytes:
+    """Serialize state as 2-space indented UTF-8 JSON with a trailing newline, with or without orjson."""
+    if HAS_ORJSON:
+        return orjson.dumps(
+            state,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE,
+        )
+    return (json.dumps(state, indent=2, ensure_ascii=False) + "\n").encode('utf-8')
+
 
 def load_state() -> Dict[str, Any]:
     """
     Loads state from JSON file with validation.
     Returns an empty dict if file doesn't exist or is corrupted.
+
+    The last state read or saved is kept in memory and a deep copy of it is
+    returned while the file's inode, mtime and size are unchanged.
     """
+    stamp = _file_stamp(STATE_FILE)
+    with _CACHE_LOCK:
+        cached = _STATE_CACHE
+    if cached and cached[0] == STATE_FILE and cached[1] == stamp:
+        return copy.deepcopy(cached[2])
+
     # Try to load main state file
-    if STATE_FILE.exists():
+    if stamp is not None:
         try:
-            with open(STATE_FILE, 'r') as f:
-                state = json.load(f)
-                logger.debug(f"Loaded state from {STATE_FILE}")
-                return state
+            state = _read_state_file(STATE_FILE)
+            logger.debug(f"Loaded state from {STATE_FILE}")
+            _cache_state(state, stamp)
+            return state
         except json.JSONDecodeError as e:
             logger.warning(f"State file corrupted: {e}. Attempting to load backup...")
             
             # Try backup if main file is corrupted
             if BACKUP_FILE.exists():
                 try:
-                    with open(BACKUP_FILE, 'r') as f:
-                        state = json.load(f)
-                        logger.info(f"[OK] Loaded state from backup: {BACKUP_FILE}")
-                        # Restore the main file from backup
-                        save_state(state)
-                        return state
+                    state = _read_state_file(BACKUP_FILE)
+                    logger.info(f"[OK] Loaded state from backup: {BACKUP_FILE}")
+                    # Restore the main file from backup
+                    save_state(state)
+                    return state
                 except json.JSONDecodeError:
                     logger.error("Backup file also corrupted. Starting with empty state.")
     
@@ -63,22 +124,36 @@ def save_state(state: Dict[str, Any]):
     try:
         # Acquire file lock to prevent concurrent writes
         with _acquire_lock():
-            # 1. Backup current state if it exists
+            # 1. Write the new state to a temporary file and sync it
+            payload = _dump_state(state)
+            fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+                getattr(os, 'fdatasync', os.fsync)(fd)  # Force write to disk
+            finally:
+                os.close(fd)
+
+            # 2. Hard-link the current state as the backup (copy if links are
+            #    unsupported) so STATE_FILE stays in place until the rename
             if STATE_FILE.exists():
                 try:
-                    STATE_FILE.replace(BACKUP_FILE)
+                    try:
+                        BACKUP_FILE.unlink()
+                    except FileNotFoundError:
+                        pass
+                    try:
+                        os.link(STATE_FILE, BACKUP_FILE)
+                    except OSError:
+                        shutil.copy2(STATE_FILE, BACKUP_FILE)
                     logger.debug(f"Backed up state to {BACKUP_FILE}")
                 except Exception as e:
                     logger.warning(f"Failed to create backup: {e}")
             
-            # 2. Write to temporary file
-            with open(temp_file, 'w') as f:
-                json.dump(state, f, indent=4)
-                f.flush()  # Ensure data is written to disk
-                os.fsync(f.fileno())  # Force write to disk
-            
             # 3. Atomic rename (this is atomic on most filesystems)
-            temp_file.replace(STATE_FILE)
+            os.replace(temp_file, STATE_FILE)
+            _cache_state(state, _file_stamp(STATE_FILE))
             
             logger.debug(f"State saved atomically to {STATE_FILE}")
     
@@ -93,7 +168,7 @@ def save_state(state: Dict[str, Any]):
         if temp_file.exists():
             try:
                 temp_file.unlink()
-            except:
+            except OSError:
                 pass
 
 
@@ -178,12 +253,11 @@ def recover_state() -> Dict[str, Any]:
     
     if BACKUP_FILE.exists():
         try:
-            with open(BACKUP_FILE, 'r') as f:
-                state = json.load(f)
-                if validate_state(state):
-                    logger.info("[OK] State recovered from backup")
-                    save_state(state)  # Restore main file
-                    return state
+            state = _read_state_file(BACKUP_FILE)
+            if validate_state(state):
+                logger.info("[OK] State recovered from backup")
+                save_state(state)  # Restore main file
+                return state
         except Exception as e:
             logger.error(f"Failed to recover from backup: {e}")
     
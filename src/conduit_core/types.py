@@ -1,8 +1,11 @@
 # src/conduit_core/types.py
 
+import codecs
 import logging
+import re
 from datetime import datetime, date
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
@@ -14,6 +17,24 @@ try:
 except ImportError:
     HAS_PANDAS = False
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+# String tables for TypeConverter.parse_value
+_NULL_STRINGS = frozenset(("null", "none", "n/a", "na", "nan"))
+_TRUE_STRINGS = frozenset(("true", "yes", "1", "t", "y"))
+_BOOL_WORDS = {"true": True, "yes": True, "false": False, "no": False}
+# Unpadded ints (bounded so int() can't hit the digit limit) and plain/exponent floats.
+# Other forms int()/float() accept ("1_000", " 8 ", "inf") still go through the casts.
+_NUMBER_RE = re.compile(
+    r'(?P<int>[+-]?[0-9]{1,18})'
+    r'|(?P<float>[+-]?(?:[0-9]+\.[0-9]*|\.[0-9]+|[0-9]+(?=[eE]))(?:[eE][+-]?[0-9]+)?)'
+)
+
 
 class TypeConverter:
     """
@@ -33,6 +54,15 @@ class TypeConverter:
         Returns:
             Converted value safe for target format
         """
+        # Common builtin types: one dict lookup on the exact type
+        convert = _SAFE_TYPE_DISPATCH.get(type(value))
+        if convert is not None:
+            return convert(value, target_format)
+        return TypeConverter._to_safe_type_generic(value, target_format)
+
+    @staticmethod
+    def _to_safe_type_generic(value: Any, target_format: str) -> Any:
+        """isinstance-based conversion for subclasses and pandas/numpy scalars."""
         # Handle None
         if value is None:
             return None
@@ -131,6 +161,20 @@ class TypeConverter:
             return None  # Convert Infinity to None
         return value
     
+    @staticmethod
+    def to_safe_floats(arr: "np.ndarray") -> "np.ndarray":
+        """
+        Vectorized _convert_float for a whole float column.
+
+        Returns an object array with NaN and +/-Infinity replaced by None.
+        """
+        if not HAS_NUMPY:
+            raise ImportError("numpy is required for to_safe_floats")
+        arr = np.asarray(arr, dtype=float)
+        out = arr.astype(object)
+        out[~np.isfinite(arr)] = None
+        return out
+    
     @staticmethod
     def parse_value(value: str, hint_type: Optional[type] = None) -> Any:
         """
@@ -147,8 +191,10 @@ class TypeConverter:
         if value == "":
             return None
         
+        lowered = value.lower()
+        
         # Handle common NULL representations
-        if value.lower() in ("null", "none", "n/a", "na", "nan"):
+        if lowered in _NULL_STRINGS:
             return None
         
         # If type hint provided, try to convert
@@ -159,7 +205,7 @@ class TypeConverter:
                 elif hint_type == float:
                     return float(value)
                 elif hint_type == bool:
-                    return value.lower() in ("true", "yes", "1", "t", "y")
+                    return lowered in _TRUE_STRINGS
                 elif hint_type == datetime:
                     return datetime.fromisoformat(value)
             except (ValueError, TypeError):
@@ -167,6 +213,15 @@ class TypeConverter:
                 return value
         
         # Auto-detect type
+        # Plain decimal numbers are the common case: classify them in one regex scan
+        match = _NUMBER_RE.fullmatch(value)
+        if match:
+            return int(value) if match.lastgroup == 'int' else float(value)
+        
+        # Boolean words never parse as numbers, so check them before paying for two failed casts
+        if lowered in _BOOL_WORDS:
+            return _BOOL_WORDS[lowered]
+        
         # Try int
         try:
             return int(value)
@@ -179,10 +234,6 @@ class TypeConverter:
         except ValueError:
             pass
         
-        # Try boolean
-        if value.lower() in ("true", "false", "yes", "no"):
-            return value.lower() in ("true", "yes")
-        
         # Try datetime (ISO format)
         try:
             return datetime.fromisoformat(value)
@@ -193,6 +244,56 @@ class TypeConverter:
         return value
 
 
+def _safe_decimal(value: Decimal, target_format: str) -> Any:
+    # Decimal('NaN') is NA to pandas, so it maps to None like float NaN
+    if value.is_nan():
+        return None
+    return TypeConverter._convert_decimal(value, target_format)
+
+
+def _safe_container(value: Any, target_format: str) -> Any:
+    if target_format == "csv":
+        # CSV can't handle nested structures
+        import json
+        return json.dumps(value)
+    return value
+
+
+def _passthrough(value: Any, target_format: str) -> Any:
+    return value
+
+
+@lru_cache(maxsize=4096)
+def _cached_isoformat(value: date) -> str:
+    return value.isoformat()
+
+
+def _safe_datetime(value: date, target_format: str) -> str:
+    # Batch loads repeat the same timestamps. Only naive values are cached:
+    # aware datetimes at the same instant compare equal across offsets but
+    # format differently.
+    if value.tzinfo is None:
+        return _cached_isoformat(value)
+    return value.isoformat()
+
+
+# Exact type -> converter(value, target_format) for TypeConverter.to_safe_type.
+# Anything not listed (subclasses, pandas/numpy scalars) takes the generic path.
+_SAFE_TYPE_DISPATCH = {
+    type(None): _passthrough,
+    str: _passthrough,
+    int: _passthrough,
+    bool: TypeConverter._convert_bool,
+    float: lambda value, target_format: TypeConverter._convert_float(value),
+    datetime: _safe_datetime,
+    date: lambda value, target_format: _cached_isoformat(value),
+    Decimal: _safe_decimal,
+    bytes: lambda value, target_format: TypeConverter._convert_bytes(value),
+    list: _safe_container,
+    dict: _safe_container,
+}
+
+
 class EncodingDetector:
     """Detects and handles file encodings"""
     
@@ -219,10 +320,19 @@ class EncodingDetector:
         """
         with open(filepath, 'rb') as f:
             sample = f.read(sample_size)
+            # Only a sample cut short of the file can end mid-character
+            truncated = bool(f.read(1))
+        
+        # A BOM settles it without trial decoding
+        if sample.startswith(codecs.BOM_UTF8):
+            logger.info("Detected encoding: utf-8-sig")
+            return 'utf-8-sig'
         
         for encoding in EncodingDetector.COMMON_ENCODINGS:
             try:
-                sample.decode(encoding)
+                # final=False lets a multi-byte character split by the sample
+                # boundary pass; a whole file must decode completely
+                codecs.getincrementaldecoder(encoding)().decode(sample, final=not truncated)
                 logger.info(f"Detected encoding: {encoding}")
                 return encoding
             except (UnicodeDecodeError, LookupError):
@@ -267,9 +377,10 @@ def sanitize_dict(data: dict, target_format: str = "json") -> dict:
     Returns:
         Sanitized dictionary
     """
-    converter = TypeConverter()
+    dispatch = _SAFE_TYPE_DISPATCH.get
+    generic = TypeConverter._to_safe_type_generic
     return {
-        key: converter.to_safe_type(value, target_format)
+        key: (dispatch(type(value)) or generic)(value, target_format)
         for key, value in data.items()
     }
 
@@ -0,0 +1,14 @@
+# tests/_assert_helpers.py
+"""
+Assertion helpers shared across the test suite.
+
+Prefer plain substring checks (``in``, ``startswith``, ``endswith``) over
+``re.search`` when asserting on CLI output, logs or generated SQL; reach for
+a regex only when the text genuinely varies.
+"""
+
+
+def assert_contains_all(haystack: str, *needles: str) -> None:
+    """Assert every needle occurs in haystack, reporting all missing ones at once."""
+    missing = [needle for needle in needles if needle not in haystack]
+    assert not missing, f"missing {missing!r} in:\n{haystack}"
@@ -1,9 +1,72 @@
 # tests/conftest.py
+#
+# The suite is safe to run in parallel with pytest-xdist (`pytest -n auto`).
+# Each xdist worker is its own process, so session-scoped fixtures (including
+# the moto backend below) are per worker; no tmp_path_factory state is shared
+# between workers.
 import pytest
+from unittest.mock import MagicMock
 from click.testing import CliRunner
 from conduit_core.cli import app  # Typer app
+from tests.fakes.destination_stub import DestinationStub
+
 
 @pytest.fixture
 def cli_runner():
     """Provide a reusable CLI test runner for Conduit Core."""
     return CliRunner()
+
+
+@pytest.fixture
+def mock_source_reading():
+    """
+    Factory for a mocked source whose read() yields the given batches.
+
+    Each read() call builds a fresh iterator, so repeated reads (e.g. preflight
+    sampling followed by the actual run) see the same data instead of an
+    exhausted one-shot iterator.
+    """
+    def _make(batches):
+        source = MagicMock()
+        source.read.side_effect = lambda *args, **kwargs: iter(batches)
+        return source
+    return _make
+
+
+@pytest.fixture
+def dest_stub():
+    """A postgresql destination that records alter_table() calls."""
+    return DestinationStub()
+
+
+@pytest.fixture(scope="session")
+def xdist_worker_id(request):
+    """The pytest-xdist worker id ('gw0', 'gw1', ...), or 'master' when not distributed."""
+    return getattr(request.config, "workerinput", {}).get("workerid", "master")
+
+
+@pytest.fixture(scope="session")
+def aws_credentials():
+    """Mock AWS credentials for testing (set once, restored at session end)."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv('AWS_ACCESS_KEY_ID', 'testing')
+        mp.setenv('AWS_SECRET_ACCESS_KEY', 'testing')
+        mp.setenv('AWS_REGION', 'us-east-1')
+        yield
+
+
+@pytest.fixture(scope="session")
+def boto_session():
+    """One boto3 Session per test process, so botocore loads service models once."""
+    boto3 = pytest.importorskip("boto3")
+    return boto3.session.Session(region_name='us-east-1')
+
+
+@pytest.fixture(scope="session")
+def _moto(aws_credentials):
+    """One moto backend per test process (i.e. per xdist worker) instead of one per test."""
+    moto = pytest.importorskip("moto")
+    m = moto.mock_aws()
+    m.start()
+    yield m
+    m.stop()
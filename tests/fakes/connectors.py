@@ -0,0 +1,45 @@
+# tests/fakes/connectors.py
+"""Hand-written source/destination fakes for engine tests, instead of nested MagicMocks."""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+from conduit_core.connectors.base import BaseSource, BaseDestination
+
+
+class FakeSource(BaseSource):
+    """Streams a fixed list of rows on every read()."""
+
+    def __init__(self, config: Any, rows: Iterable[Dict[str, Any]] = ()):
+        super().__init__(config)
+        self.rows = list(rows)
+
+    def read(self, query: str = None) -> Iterable[Dict[str, Any]]:
+        yield from self.rows
+
+
+class FakeDestination(BaseDestination):
+    """Records written rows and DDL statements; reports that the table does not exist yet."""
+
+    database = None
+    db_schema = None
+
+    def __init__(self, config: Any):
+        super().__init__(config)
+        self.written: List[Dict[str, Any]] = []
+        self.ddl_calls: List[str] = []
+        self.finalized = False
+
+    def write(self, records: Iterable[Dict[str, Any]]):
+        self.written.extend(records)
+
+    def finalize(self):
+        self.finalized = True
+
+    def execute_ddl(self, sql: str) -> None:
+        self.ddl_calls.append(sql)
+
+    def table_exists(self) -> bool:
+        return False
+
+    def get_table_schema(self) -> Optional[Dict[str, Any]]:
+        return {"columns": []}
@@ -0,0 +1,16 @@
+# tests/fakes/destination_stub.py
+"""Minimal destination for schema-evolution tests that only need alter_table."""
+
+from types import SimpleNamespace
+from typing import List
+
+
+class DestinationStub:
+    """Records ALTER TABLE statements instead of executing them."""
+
+    def __init__(self, dialect: str = 'postgresql'):
+        self.config = SimpleNamespace(type=dialect)
+        self.alter_calls: List[str] = []
+
+    def alter_table(self, sql: str) -> None:
+        self.alter_calls.append(sql)
@@ -0,0 +1,75 @@
+# tests/fakes/fake_s3.py
+"""Dict-backed stand-in for a boto3 S3 client, for tests that don't need moto."""
+
+from pathlib import Path
+from typing import Any, Dict, Set, Tuple
+
+from botocore.exceptions import ClientError
+
+
+def _client_error(code: str, message: str, operation: str) -> ClientError:
+    return ClientError({'Error': {'Code': code, 'Message': message}}, operation)
+
+
+class _Body:
+    def __init__(self, data: bytes):
+        self._data = data
+
+    def read(self) -> bytes:
+        return self._data
+
+
+class FakeS3Client:
+    """Implements the subset of the S3 client API used by the S3 connectors."""
+
+    def __init__(self):
+        self.buckets: Set[str] = set()
+        self.objects: Dict[Tuple[str, str], bytes] = {}
+
+    def _require_bucket(self, bucket: str, operation: str):
+        if bucket not in self.buckets:
+            raise _client_error('NoSuchBucket', 'The specified bucket does not exist', operation)
+
+    def _require_object(self, bucket: str, key: str, operation: str) -> bytes:
+        self._require_bucket(bucket, operation)
+        try:
+            return self.objects[(bucket, key)]
+        except KeyError:
+            raise _client_error('404', 'Not Found', operation) from None
+
+    def create_bucket(self, Bucket: str, **kwargs) -> Dict[str, Any]:
+        self.buckets.add(Bucket)
+        return {}
+
+    def head_bucket(self, Bucket: str) -> Dict[str, Any]:
+        self._require_bucket(Bucket, 'HeadBucket')
+        return {}
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes = b'', **kwargs) -> Dict[str, Any]:
+        self._require_bucket(Bucket, 'PutObject')
+        self.objects[(Bucket, Key)] = Body.encode('utf-8') if isinstance(Body, str) else bytes(Body)
+        return {}
+
+    def get_object(self, Bucket: str, Key: str) -> Dict[str, Any]:
+        return {'Body': _Body(self._require_object(Bucket, Key, 'GetObject'))}
+
+    def head_object(self, Bucket: str, Key: str) -> Dict[str, Any]:
+        return {'ContentLength': len(self._require_object(Bucket, Key, 'HeadObject'))}
+
+    def list_objects_v2(self, Bucket: str, Prefix: str = '') -> Dict[str, Any]:
+        self._require_bucket(Bucket, 'ListObjectsV2')
+        contents = [
+            {'Key': key, 'Size': len(data)}
+            for (bucket, key), data in sorted(self.objects.items())
+            if bucket == Bucket and key.startswith(Prefix)
+        ]
+        response: Dict[str, Any] = {'KeyCount': len(contents)}
+        if contents:
+            response['Contents'] = contents
+        return response
+
+    def download_file(self, Bucket: str, Key: str, Filename: str) -> None:
+        Path(Filename).write_bytes(self._require_object(Bucket, Key, 'GetObject'))
+
+    def upload_file(self, Filename: str, Bucket: str, Key: str) -> None:
+        self.put_object(Bucket=Bucket, Key=Key, Body=Path(Filename).read_bytes())
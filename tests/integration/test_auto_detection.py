@@ -1,5 +1,7 @@
 # tests/integration/test_auto_detection.py
 
+import csv
+
 import pytest
 from pathlib import Path
 
@@ -84,4 +86,13 @@ def test_pipeline_with_auto_detection(base_config, tmp_path, caplog):
     lines = dest_path.read_text().strip().split('\n')
     assert len(lines) == 2
     import json
-    assert json.loads(lines[0]) == {"id": "1", "name": "test", "value": "10.5"} # CSV reads as string by default
\ No newline at end of file
+    assert json.loads(lines[0]) == {"id": "1", "name": "test", "value": "10.5"} # CSV reads as string by default
+
+
+def test_detect_delimiter_ambiguous_counts_fall_back(tmp_path):
+    # ',' and ';' are both consistent per line, so the sniffer decides
+    text = "a;b,c;d\n1;2,3;4\n5;6,7;8\n"
+    path = tmp_path / "ambiguous.csv"
+    path.write_text(text)
+    expected = csv.Sniffer().sniff(text, delimiters=''.join(CsvDelimiterDetector.COMMON_DELIMITERS)).delimiter
+    assert CsvDelimiterDetector.detect_delimiter(path) == expected
@@ -5,4 +5,19 @@ import pytest
 def test_cli_imports():
     """Test that CLI module can be imported."""
     from conduit_core.cli import app
-    assert app is not None
\ No newline at end of file
+    assert app is not None
+
+def test_schema_command_exit_code(tmp_path):
+    """The schema command forwards _schema_impl's return code as the exit code."""
+    from typer.testing import CliRunner
+    from conduit_core.cli import app
+    config_file = tmp_path / "ingest.yml"
+    config_file.write_text(
+        "sources:\n  - name: s\n    type: csv\n    path: fake.csv\n"
+        "destinations: []\n"
+        "resources:\n  - name: r\n    source: s\n    destination: ''\n    query: n/a\n"
+    )
+
+    result = CliRunner().invoke(app, ["schema", "--file", str(config_file), "missing"])
+
+    assert result.exit_code == 1
@@ -38,4 +38,31 @@ def test_connector_type_derivation():
 
     assert _derive_connector_type("CsvSource", "Source") == "csv"
     assert _derive_connector_type("AzureSqlSource", "Source") == "azuresql"
-    assert _derive_connector_type("PostgresDestination", "Destination") == "postgres"
\ No newline at end of file
+    assert _derive_connector_type("PostgresDestination", "Destination") == "postgres"
+
+def test_connector_maps_match_discovery():
+    """The lazy maps expose the same connector classes as full discovery."""
+    source_map, destination_map = discover_connectors()
+
+    assert set(source_map) <= set(get_source_connector_map())
+    assert set(destination_map) <= set(get_destination_connector_map())
+    assert get_source_connector_map()["csv"] is source_map["csv"]
+    assert get_destination_connector_map()["postgresql"] is get_destination_connector_map()["postgres"]
+    assert get_source_connector_map().get("does_not_exist") is None
+
+
+def test_connector_maps_import_modules_lazily():
+    """Looking up the CSV connector must not import database drivers."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "from conduit_core.connectors.registry import get_source_connector_map, get_destination_connector_map\n"
+        "get_source_connector_map()['csv']\n"
+        "assert 'postgres' in get_destination_connector_map()\n"
+        "assert 'psycopg2' not in sys.modules, 'psycopg2 imported eagerly'\n"
+        "assert 'snowflake.connector' not in sys.modules, 'snowflake imported eagerly'\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
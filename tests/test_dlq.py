@@ -146,6 +146,18 @@ def test_error_log_add_quality_error():
     assert len(error_log.errors) == 0
     assert len(error_log.quality_errors) == 1
 
+def test_error_log_add_quality_errors_batch():
+    error_log = ErrorLog("test_resource")
+    added = error_log.add_quality_errors([
+        ({'id': 1}, "col(check): Fail"),
+        ({'id': 2}, "col(check): Fail", 7),
+    ])
+    assert added == 2
+    assert error_log.error_count() == 2
+    assert [e["row_number"] for e in error_log.quality_errors] == [None, 7]
+    assert error_log.quality_errors[0]["timestamp"] == error_log.quality_errors[1]["timestamp"]
+    assert all(e["failure_type"] == "quality_check" for e in error_log.quality_errors)
+
 def test_error_log_saves_to_file(tmp_path):
     error_dir = tmp_path / "errors_test_save"
     error_log = ErrorLog("test_save_resource", error_dir=error_dir)
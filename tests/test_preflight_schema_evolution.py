@@ -36,9 +36,9 @@ def test_config(tmp_path):
     )
 
 
-def test_preflight_shows_schema_evolution_preview(test_config, tmp_path):
+def test_preflight_shows_schema_evolution_preview(test_config, tmp_path, mock_source_reading):
     """Preflight should show schema evolution preview when changes detected."""
-    from unittest.mock import MagicMock, patch
+    from unittest.mock import patch
     from conduit_core.connectors.postgresql import PostgresDestination
     from conduit_core.schema_store import SchemaStore
     
@@ -53,8 +53,7 @@ def test_preflight_shows_schema_evolution_preview(test_config, tmp_path):
     schema_store.save_schema('test_resource', baseline_schema)
     
     # Mock CSV source
-    mock_source = MagicMock()
-    mock_source.read.return_value = iter([[
+    mock_source = mock_source_reading([[
         {'id': 1, 'name': 'Alice', 'email': 'alice@test.com'}
     ]])
     
@@ -89,9 +88,9 @@ def test_preflight_shows_schema_evolution_preview(test_config, tmp_path):
     assert 'Version:' in evolution_check['message']
 
 
-def test_preflight_no_preview_when_no_changes(test_config, tmp_path):
+def test_preflight_no_preview_when_no_changes(test_config, tmp_path, mock_source_reading):
     """Preflight should not show preview when schemas match."""
-    from unittest.mock import MagicMock, patch
+    from unittest.mock import patch
     from conduit_core.connectors.postgresql import PostgresDestination
     from conduit_core.schema_store import SchemaStore
     
@@ -106,8 +105,7 @@ def test_preflight_no_preview_when_no_changes(test_config, tmp_path):
     }
     schema_store.save_schema('test_resource', baseline_schema)
     
-    mock_source = MagicMock()
-    mock_source.read.return_value = iter([[
+    mock_source = mock_source_reading([[
         {'id': 1, 'name': 'Alice', 'email': 'alice@test.com'}
     ]])
     
@@ -2,6 +2,7 @@
 
 import pytest
 import logging
+import re
 from typing import Dict, Any, List, Set
 from unittest.mock import patch, MagicMock
 
@@ -20,10 +21,14 @@ from conduit_core.quality import (
 )
 from conduit_core.errors import DataQualityError, ErrorLog
 
+_EMAIL_PAT = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
+_EMAIL_RE = re.compile(_EMAIL_PAT)
+
 # --- Fixtures ---
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_records() -> List[Dict[str, Any]]:
+    # Module-scoped: tests only read these records. Deepcopy in a test before mutating.
     return [
         {"id": 1, "email": "test@example.com", "age": 30, "price": 10.50, "status": "active"},
         {"id": 2, "email": "invalid-email", "age": 15, "price": -5.00, "status": "pending"},
@@ -36,11 +41,15 @@ def sample_records() -> List[Dict[str, Any]]:
 # (These tests call validators directly, so they are unchanged and correct)
 
 def test_regex_validator_email():
-    email_pattern = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
-    assert regex_validator("test@example.com", pattern=email_pattern) is True
-    assert regex_validator("invalid-email", pattern=email_pattern) is False
-    assert regex_validator(None, pattern=email_pattern) is False
-    assert regex_validator(123, pattern=email_pattern) is False
+    assert regex_validator("test@example.com", pattern=_EMAIL_PAT) is True
+    assert regex_validator("invalid-email", pattern=_EMAIL_PAT) is False
+    assert regex_validator(None, pattern=_EMAIL_PAT) is False
+    assert regex_validator(123, pattern=_EMAIL_PAT) is False
+
+def test_regex_validator_accepts_compiled_pattern():
+    assert regex_validator("test@example.com", pattern=_EMAIL_RE) is True
+    assert regex_validator("invalid-email", pattern=_EMAIL_RE) is False
+    assert regex_validator("Test@Example.com", pattern=re.compile("test@example.com", re.IGNORECASE)) is True
 
 @pytest.mark.skip(reason="Example test, implement phone pattern if needed")
 def test_regex_validator_phone():
@@ -97,7 +106,7 @@ def test_enum_validator_allowed_values():
 def test_quality_check_action_dlq(sample_records):
     """Test default 'dlq' action logs errors but doesn't stop."""
     checks = [
-        QualityCheck(column="email", check="regex", pattern=r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"),
+        QualityCheck(column="email", check="regex", pattern=_EMAIL_PAT),
         QualityCheck(column="age", check="range", min_value=18),
     ]
     validator = QualityValidator(checks)
@@ -107,16 +116,16 @@ def test_quality_check_action_dlq(sample_records):
 
 
     valid_records = []
-    invalid_count = 0
+    failures = []
     for record in sample_records:
         # *** FIX: Pass empty dict for unique sets state ***
         result = validator.validate_record(record, batch_unique_sets)
         if result.is_valid:
             valid_records.append(record)
         else:
-             invalid_count += 1
              summary = "; ".join([f"{fc.column}({fc.check_name})" for fc in result.failed_checks])
-             error_log.add_quality_error(record, summary)
+             failures.append((record, summary))
+    invalid_count = error_log.add_quality_errors(failures)
 
     # R1: Valid
     # R2: Invalid (age & email fail)
@@ -202,6 +211,21 @@ def test_multiple_checks_per_column(sample_records):
     assert results[4].is_valid is True, f"Record 5 (age 50) failed unexpectedly: {results[4].failed_checks}"
 
 
+def test_fail_action_checks_short_circuit(sample_records):
+    """FAIL-action checks run first and stop validation of the record on failure."""
+    checks = [
+        QualityCheck(column="email", check="regex", pattern=r".+@.+\..+"),
+        QualityCheck(column="age", check="range", min_value=18, action=QualityAction.FAIL),
+        QualityCheck(column="price", check="range", min_value=0.0),
+    ]
+    validator = QualityValidator(checks)
+    assert [c.column for c in validator.checks] == ["age", "email", "price"]
+
+    result = validator.validate_record(sample_records[1], {}) # age 15, bad email, negative price
+    assert result.is_valid is False
+    assert [(fc.column, fc.check_name) for fc in result.failed_checks] == [("age", "range")]
+
+
 @pytest.mark.skip(reason="Logic tested implicitly via engine tests later")
 def test_quality_checks_disabled_by_default():
     pass
@@ -261,6 +285,16 @@ def test_batch_validation_unique_state(sample_records):
     assert batch_result_2.invalid_records[0].record["email"] == "duplicate@example.com"
 
 
+def test_record_validation_with_batch_state(sample_records):
+    validator = QualityValidator([QualityCheck(column="id", check="unique")])
+    batch_unique_sets = validator.new_batch_state()
+    assert batch_unique_sets == {"id_unique": set()}
+
+    results = [validator.validate_record(r, batch_unique_sets) for r in sample_records]
+    assert [r.is_valid for r in results] == [True, True, True, False, True]
+    assert validator.new_batch_state() == {"id_unique": set()}
+
+
 @pytest.mark.skip(reason="Performance test is subjective/complex")
 def test_batch_validation_performance():
     pass
@@ -278,13 +312,15 @@ def test_quality_errors_in_error_log(sample_records):
     # State for unique checks (empty as none are used here)
     batch_unique_sets: Dict[str, Set[Any]] = {}
 
+    failures = []
     for record in sample_records:
         # *** FIX: Pass empty dict for unique sets state ***
         result = validator.validate_record(record, batch_unique_sets)
         if not result.is_valid:
              # Assume default DLQ action
              summary = "; ".join([f"{fc.column}({fc.check_name}): {fc.details or 'Failed'}" for fc in result.failed_checks])
-             error_log.add_quality_error(record, summary)
+             failures.append((record, summary))
+    error_log.add_quality_errors(failures)
 
     assert error_log.error_count() == 2
     assert len(error_log.quality_errors) == 2
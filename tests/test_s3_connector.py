@@ -1,47 +1,85 @@
 # tests/test_s3_connector.py
 
+import csv
+import io
+import json
 import pytest
-import os
-from moto import mock_aws
-import boto3
+from itertools import islice
+from uuid import uuid4
+from botocore.config import Config
+from botocore.exceptions import ClientError
 from conduit_core.connectors.s3 import S3Source, S3Destination
 from conduit_core.config import Source as SourceConfig
 from conduit_core.config import Destination as DestinationConfig
+from tests.fakes.fake_s3 import FakeS3Client
 
 
-@pytest.fixture
-def aws_credentials():
-    """Mock AWS credentials for testing."""
-    os.environ['AWS_ACCESS_KEY_ID'] = 'testing'
-    os.environ['AWS_SECRET_ACCESS_KEY'] = 'testing'
-    os.environ['AWS_REGION'] = 'us-east-1'
+def make_csv_bytes(rows):
+    """Encode a list of dicts as CSV bytes (header from the first row)."""
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=list(rows[0].keys()), lineterminator='\n')
+    writer.writeheader()
+    writer.writerows(rows)
+    return buf.getvalue().encode('utf-8')
+
+
+def make_json_bytes(rows):
+    """Encode a list of dicts as a JSON array in bytes."""
+    return json.dumps(rows).encode('utf-8')
+
+
+@pytest.fixture(scope="session")
+def s3_client(_moto, boto_session):
+    """Create a mocked S3 client from the shared session, shared by all tests."""
+    # moto is in-process, so retries only slow down expected failures.
+    # Requests stay signed: moto treats unsigned requests as anonymous and
+    # denies object reads.
+    config = Config(retries={'max_attempts': 1, 'mode': 'standard'})
+    return boto_session.client('s3', config=config)
 
 
 @pytest.fixture
-def s3_client(aws_credentials):
-    """Create a mocked S3 client."""
-    with mock_aws():
-        s3 = boto3.client('s3', region_name='us-east-1')
-        yield s3
+def connector_uses_s3_client(s3_client, monkeypatch):
+    """Make S3Source/S3Destination reuse the shared moto client instead of building their own."""
+    monkeypatch.setattr("conduit_core.connectors.s3.boto3.client", lambda *_a, **_kw: s3_client)
 
 
 @pytest.fixture
-def test_bucket(s3_client):
-    """Create a test S3 bucket."""
-    bucket_name = 'test-bucket'
+def test_bucket(s3_client, xdist_worker_id):
+    """Create a uniquely named test S3 bucket and empty/delete it afterwards."""
+    bucket_name = f"test-bucket-{xdist_worker_id}-{uuid4().hex[:8]}"
     s3_client.create_bucket(Bucket=bucket_name)
-    return bucket_name
+    yield bucket_name
+
+    objects = s3_client.list_objects_v2(Bucket=bucket_name).get('Contents', [])
+    if objects:
+        s3_client.delete_objects(
+            Bucket=bucket_name,
+            Delete={'Objects': [{'Key': obj['Key']} for obj in objects]}
+        )
+    s3_client.delete_bucket(Bucket=bucket_name)
+
+
+@pytest.fixture
+def fake_s3(monkeypatch):
+    """In-process S3 stand-in for tests that only exercise connector logic."""
+    client = FakeS3Client()
+    client.create_bucket(Bucket='test-bucket')
+    monkeypatch.setattr("conduit_core.connectors.s3.boto3.client", lambda *_a, **_kw: client)
+    return client
 
 
 @pytest.mark.skip(reason="Requires real S3 credentials")
-def test_s3_source_reads_csv(s3_client, test_bucket):
+def test_s3_source_reads_csv(s3_client, test_bucket, connector_uses_s3_client):
     """Test that S3Source can read a CSV file from S3."""
     # Upload a test CSV to S3
-    csv_content = "id,name,email\n1,Alice,alice@example.com\n2,Bob,bob@example.com"
     s3_client.put_object(
         Bucket=test_bucket,
         Key='data/test.csv',
-        Body=csv_content.encode('utf-8')
+        Body=make_csv_bytes([
+            {'id': 1, 'name': 'Alice', 'email': 'alice@example.com'},
+            {'id': 2, 'name': 'Bob', 'email': 'bob@example.com'},
+        ])
     )
 
     # Create S3Source
@@ -53,8 +91,8 @@ def test_s3_source_reads_csv(s3_client, test_bucket):
     )
     source = S3Source(config)
 
-    # Read records
-    records = list(source.read())
+    # Read records (islice of 3 still proves there are exactly 2)
+    records = list(islice(source.read(), 3))
 
     # Verify
     assert len(records) == 2
@@ -64,14 +102,13 @@ def test_s3_source_reads_csv(s3_client, test_bucket):
 
 
 @pytest.mark.skip(reason="Requires real S3 credentials")
-def test_s3_source_reads_json(s3_client, test_bucket):
+def test_s3_source_reads_json(s3_client, test_bucket, connector_uses_s3_client):
     """Test that S3Source can read a JSON file from S3."""
     # Upload a test JSON to S3
-    json_content = '[{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}]'
     s3_client.put_object(
         Bucket=test_bucket,
         Key='data/test.json',
-        Body=json_content.encode('utf-8')
+        Body=make_json_bytes([{'id': 1, 'name': 'Alice'}, {'id': 2, 'name': 'Bob'}])
     )
 
     # Create S3Source
@@ -83,8 +120,8 @@ def test_s3_source_reads_json(s3_client, test_bucket):
     )
     source = S3Source(config)
 
-    # Read records
-    records = list(source.read())
+    # Read records (islice of 3 still proves there are exactly 2)
+    records = list(islice(source.read(), 3))
 
     # Verify
     assert len(records) == 2
@@ -92,9 +129,8 @@ def test_s3_source_reads_json(s3_client, test_bucket):
     assert records[0]['name'] == 'Alice'
 
 
-@pytest.mark.skip(reason="Requires real S3 credentials")
-def test_s3_destination_writes_csv(s3_client, test_bucket):
-    """Test that S3Destination can write a CSV file to S3."""
+def test_s3_destination_writes_csv(s3_client, test_bucket, connector_uses_s3_client):
+    """End-to-end: S3Destination uploads the finalized file (moto-backed)."""
     # Create S3Destination
     config = DestinationConfig(
         name='test_dest',
@@ -110,6 +146,7 @@ def test_s3_destination_writes_csv(s3_client, test_bucket):
         {'id': '2', 'name': 'Bob', 'email': 'bob@example.com'}
     ]
     destination.write(records)
+    destination.finalize()
 
     # Verify file exists in S3
     response = s3_client.get_object(Bucket=test_bucket, Key='output/result.csv')
@@ -120,35 +157,46 @@ def test_s3_destination_writes_csv(s3_client, test_bucket):
     assert 'Bob' in content
 
 
-@pytest.mark.skip(reason="Requires real S3 credentials")
-def test_s3_destination_writes_json(s3_client, test_bucket):
-    """Test that S3Destination can write a JSON file to S3."""
-    # Create S3Destination
+def _sink_destination(path):
+    """S3Destination that serializes into a BytesIO instead of uploading."""
+    sink = io.BytesIO()
     config = DestinationConfig(
         name='test_dest',
         type='s3',
-        bucket=test_bucket,
-        path='output/result.json'
+        bucket='test-bucket',
+        path=path
     )
-    destination = S3Destination(config)
+    return S3Destination(config, _sink_factory=lambda: sink), sink
 
-    # Write records
+
+def test_s3_destination_serializes_csv():
+    """Test that S3Destination produces a valid CSV file."""
+    destination, sink = _sink_destination('output/result.csv')
+    records = [
+        {'id': '1', 'name': 'Alice', 'email': 'alice@example.com'},
+        {'id': '2', 'name': 'Bob', 'email': 'bob@example.com'}
+    ]
+    destination.write(records)
+    destination.finalize()
+
+    content = sink.getvalue().decode('utf-8')
+    assert list(csv.DictReader(io.StringIO(content))) == records
+
+
+def test_s3_destination_serializes_json():
+    """Test that S3Destination produces a valid JSON file."""
+    destination, sink = _sink_destination('output/result.json')
     records = [
         {'id': 1, 'name': 'Alice'},
         {'id': 2, 'name': 'Bob'}
     ]
     destination.write(records)
+    destination.finalize()
 
-    # Verify file exists in S3
-    response = s3_client.get_object(Bucket=test_bucket, Key='output/result.json')
-    content = response['Body'].read().decode('utf-8')
-
-    assert 'Alice' in content
-    assert 'Bob' in content
+    assert json.loads(sink.getvalue()) == records
 
 
-@pytest.mark.skip(reason="Requires real S3 credentials")
-def test_s3_source_missing_bucket_raises_error():
+def test_s3_source_missing_bucket_raises_error(fake_s3):
     """Test that S3Source raises error when bucket is missing."""
     config = SourceConfig(
         name='test_source',
@@ -157,7 +205,7 @@ def test_s3_source_missing_bucket_raises_error():
         # bucket is missing
     )
 
-    with pytest.raises(ValueError, match="requires 'bucket'"):
+    with pytest.raises(ValueError, match="requires a 'bucket'"):
         S3Source(config)
 
 
@@ -191,20 +239,44 @@ def test_s3_source_nonexistent_key_raises_error(s3_client, test_bucket):
         list(source.read())
 
 
-@pytest.mark.skip(reason="Requires real S3 credentials")
-def test_s3_destination_empty_records(s3_client, test_bucket):
+def test_s3_destination_empty_records(fake_s3):
     """Test that S3Destination handles empty records gracefully."""
     config = DestinationConfig(
         name='test_dest',
         type='s3',
-        bucket=test_bucket,
+        bucket='test-bucket',
         path='output/empty.csv'
     )
     destination = S3Destination(config)
 
     # Write empty list - should not create file
     destination.write([])
+    destination.finalize()
 
     # Verify no file was created
-    objects = s3_client.list_objects_v2(Bucket=test_bucket, Prefix='output/empty.csv')
-    assert 'Contents' not in objects
\ No newline at end of file
+    with pytest.raises(ClientError) as excinfo:
+        fake_s3.head_object(Bucket='test-bucket', Key='output/empty.csv')
+    assert excinfo.value.response['Error']['Code'] == '404'
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize('n_rows', [10_000])
+def test_s3_source_reads_large_csv(fake_s3, n_rows):
+    """Throughput check: S3Source streams a large CSV object end to end."""
+    rows = [{'id': i, 'name': f'user_{i}', 'email': f'user_{i}@example.com'} for i in range(n_rows)]
+    fake_s3.put_object(Bucket='test-bucket', Key='data/large.csv', Body=make_csv_bytes(rows))
+
+    config = SourceConfig(
+        name='test_source',
+        type='s3',
+        bucket='test-bucket',
+        path='data/large.csv'
+    )
+    source = S3Source(config)
+
+    count = 0
+    last = None
+    for last in source.read():
+        count += 1
+    assert count == n_rows
+    assert last['id'] == str(n_rows - 1)
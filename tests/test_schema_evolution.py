@@ -1,9 +1,10 @@
 # tests/test_schema_evolution.py
 
+import json
 import pytest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 from pathlib import Path
-import json
 import logging  # Import logging
 
 from conduit_core.schema_evolution import (
@@ -17,57 +18,80 @@ from conduit_core.config import SchemaEvolutionConfig
 from conduit_core.schema import ColumnDefinition
 
 # --- Mock Schemas ---
+# Lowercase, three-column schemas shared by this module's fixtures.
+
+_SCHEMA_V1 = {
+    "columns": [
+        {"name": "id", "type": "integer", "nullable": False},
+        {"name": "name", "type": "string", "nullable": True},
+        {"name": "created_at", "type": "timestamp", "nullable": True}
+    ]
+}
+
+# V1 + added 'email' column
+_SCHEMA_V2_ADDED_COL = {
+    "columns": [
+        {"name": "id", "type": "integer", "nullable": False},
+        {"name": "name", "type": "string", "nullable": True},
+        {"name": "created_at", "type": "timestamp", "nullable": True},
+        {"name": "email", "type": "string", "nullable": True}
+    ]
+}
+
+# V1 - removed 'created_at'
+_SCHEMA_V3_REMOVED_COL = {
+    "columns": [
+        {"name": "id", "type": "integer", "nullable": False},
+        {"name": "name", "type": "string", "nullable": True}
+    ]
+}
+
+# V1 + 'id' type changed from integer to string
+_SCHEMA_V4_TYPE_CHANGE = {
+    "columns": [
+        {"name": "id", "type": "string", "nullable": False},
+        {"name": "name", "type": "string", "nullable": True},
+        {"name": "created_at", "type": "timestamp", "nullable": True}
+    ]
+}
 
 @pytest.fixture
 def schema_v1():
-    return {
-        "columns": [
-            {"name": "id", "type": "integer", "nullable": False},
-            {"name": "name", "type": "string", "nullable": True},
-            {"name": "created_at", "type": "timestamp", "nullable": True}
-        ]
-    }
+    return _SCHEMA_V1
 
 @pytest.fixture
 def schema_v2_added_col():
-    """V1 + added 'email' column"""
-    return {
-        "columns": [
-            {"name": "id", "type": "integer", "nullable": False},
-            {"name": "name", "type": "string", "nullable": True},
-            {"name": "created_at", "type": "timestamp", "nullable": True},
-            {"name": "email", "type": "string", "nullable": True}
-        ]
-    }
+    return _SCHEMA_V2_ADDED_COL
 
 @pytest.fixture
 def schema_v3_removed_col():
-    """V1 - removed 'created_at'"""
-    return {
-        "columns": [
-            {"name": "id", "type": "integer", "nullable": False},
-            {"name": "name", "type": "string", "nullable": True}
-        ]
-    }
+    return _SCHEMA_V3_REMOVED_COL
 
 @pytest.fixture
 def schema_v4_type_change():
-    """V1 + 'id' type changed from integer to string"""
-    return {
-        "columns": [
-            {"name": "id", "type": "string", "nullable": False},
-            {"name": "name", "type": "string", "nullable": True},
-            {"name": "created_at", "type": "timestamp", "nullable": True}
-        ]
-    }
+    return _SCHEMA_V4_TYPE_CHANGE
 
-@pytest.fixture
-def mock_destination():
-    """Mock destination connector."""
-    dest = MagicMock()
-    dest.config.type = "postgresql"
-    dest.alter_table = MagicMock()
-    return dest
+
+def _with_type_case(schema, type_case):
+    if type_case == "lower":
+        return schema
+    return {"columns": [{**col, "type": col["type"].upper()} for col in schema["columns"]]}
+
+# Sources report types as "integer" or "INTEGER" depending on the connector
+_SCHEMAS_BY_TYPE_CASE = {
+    type_case: SimpleNamespace(
+        v1=_with_type_case(_SCHEMA_V1, type_case),
+        added=_with_type_case(_SCHEMA_V2_ADDED_COL, type_case),
+        removed=_with_type_case(_SCHEMA_V3_REMOVED_COL, type_case),
+        type_change=_with_type_case(_SCHEMA_V4_TYPE_CHANGE, type_case),
+    )
+    for type_case in ("lower", "upper")
+}
+
+@pytest.fixture(params=["lower", "upper"])
+def schemas(request):
+    """The V1-V4 schemas, with lowercase or uppercase type names."""
+    return _SCHEMAS_BY_TYPE_CASE[request.param]
 
 @pytest.fixture
 def tmp_schema_store(tmp_path):
@@ -78,49 +102,42 @@ def tmp_schema_store(tmp_path):
 
 # --- Test Cases ---
 
-def test_detect_new_columns(schema_v1, schema_v2_added_col):
-    """Test_detect_new_columns"""
-    changes = SchemaEvolutionManager.compare_schemas(schema_v1, schema_v2_added_col)
-    assert changes.has_changes()
-    assert len(changes.added_columns) == 1
-    assert changes.added_columns[0].name == "email"
-    assert len(changes.removed_columns) == 0
-    assert len(changes.type_changes) == 0
-
-def test_detect_removed_columns(schema_v1, schema_v3_removed_col):
-    """Test_detect_removed_columns"""
-    changes = SchemaEvolutionManager.compare_schemas(schema_v1, schema_v3_removed_col)
-    assert changes.has_changes()
-    assert len(changes.removed_columns) == 1
-    assert changes.removed_columns[0].name == "created_at"
-    assert len(changes.added_columns) == 0
-    assert len(changes.type_changes) == 0
-
-def test_detect_type_changes(schema_v1, schema_v4_type_change):
-    """Test_detect_type_changes"""
-    changes = SchemaEvolutionManager.compare_schemas(schema_v1, schema_v4_type_change)
-    assert changes.has_changes()
-    assert len(changes.type_changes) == 1
-    assert changes.type_changes[0].column == "id"
-    assert changes.type_changes[0].old_type == "integer"
-    assert changes.type_changes[0].new_type == "string"
-    assert len(changes.added_columns) == 0
-    assert len(changes.removed_columns) == 0
+COMPARE_CASES = [
+    pytest.param(_SCHEMA_V1, _SCHEMA_V2_ADDED_COL, ["email"], [], [], id="added"),
+    pytest.param(_SCHEMA_V1, _SCHEMA_V3_REMOVED_COL, [], ["created_at"], [], id="removed"),
+    pytest.param(_SCHEMA_V1, _SCHEMA_V4_TYPE_CHANGE, [], [], [("id", "integer", "string")], id="type_change"),
+    pytest.param(_SCHEMA_V1, _SCHEMA_V1, [], [], [], id="unchanged"),
+    pytest.param(
+        _SCHEMA_V3_REMOVED_COL,
+        {"columns": _SCHEMA_V2_ADDED_COL["columns"] + [{"name": "age", "type": "integer", "nullable": True}]},
+        ["created_at", "email", "age"], [], [],
+        id="added_in_schema_order",
+    ),
+]
+
+@pytest.mark.parametrize("old,new,added,removed,type_changes", COMPARE_CASES)
+def test_compare_schemas(old, new, added, removed, type_changes):
+    """Test that compare_schemas reports exactly the expected changes"""
+    changes = SchemaEvolutionManager.compare_schemas(old, new)
+    assert changes.has_changes() == bool(added or removed or type_changes)
+    assert [c.name for c in changes.added_columns] == added
+    assert [c.name for c in changes.removed_columns] == removed
+    assert [(t.column, t.old_type, t.new_type) for t in changes.type_changes] == type_changes
 
 @patch('conduit_core.schema_evolution.TableAutoCreator.generate_add_column_sql')
-def test_auto_mode_adds_nullable_column(mock_gen_sql, schema_v1, schema_v2_added_col, mock_destination):
+def test_auto_mode_adds_nullable_column(mock_gen_sql, schemas, dest_stub):
     """Test_auto_mode_adds_nullable_column"""
     mock_gen_sql.return_value = "ALTER TABLE test_table ADD COLUMN email TEXT;"
     manager = SchemaEvolutionManager()
-    changes = manager.compare_schemas(schema_v1, schema_v2_added_col)
-    config = SchemaEvolutionConfig(mode="auto", on_new_column="add_nullable")
+    changes = manager.compare_schemas(schemas.v1, schemas.added)
+    config = SchemaEvolutionConfig(mode="auto", on_new_column="add_nullable", track_history=False)
     
-    manager.apply_evolution(mock_destination, "test_table", changes, config, "test_resource")
+    manager.apply_evolution(dest_stub, "test_table", changes, config, "test_resource")
     
     mock_gen_sql.assert_called_once_with("test_table", changes.added_columns[0], "postgresql")
-    mock_destination.alter_table.assert_called_once_with("ALTER TABLE test_table ADD COLUMN email TEXT;")
+    assert dest_stub.alter_calls == ["ALTER TABLE test_table ADD COLUMN email TEXT;"]
 
-def test_strict_mode_fails_on_changes(schema_v1, schema_v2_added_col, mock_destination):
+def test_strict_mode_fails_on_changes(schema_v1, schema_v2_added_col, dest_stub):
     """Test_strict_mode_fails_on_changes"""
     manager = SchemaEvolutionManager()
     changes = manager.compare_schemas(schema_v1, schema_v2_added_col)
@@ -128,20 +145,24 @@ def test_strict_mode_fails_on_changes(schema_v1, schema_v2_added_col, mock_desti
     
     # *** FIX 1: Changed match="strict mode" to match="strict" ***
     with pytest.raises(SchemaEvolutionError, match="strict"):
-        manager.apply_evolution(mock_destination, "test_table", changes, config, "test_resource")
+        manager.apply_evolution(dest_stub, "test_table", changes, config, "test_resource")
     
-    mock_destination.alter_table.assert_not_called()
+    assert dest_stub.alter_calls == []
 
-def test_manual_mode_warns_only(schema_v1, schema_v2_added_col, mock_destination, caplog):
+def test_manual_mode_warns_only(schema_v1, schema_v2_added_col, dest_stub, caplog):
     """Test_manual_mode_warns_only"""
     manager = SchemaEvolutionManager()
     changes = manager.compare_schemas(schema_v1, schema_v2_added_col)
     config = SchemaEvolutionConfig(mode="manual")
     
-    manager.apply_evolution(mock_destination, "test_table", changes, config, "test_resource")
+    with caplog.at_level(logging.WARNING, logger="conduit_core.schema_evolution"):
+        manager.apply_evolution(dest_stub, "test_table", changes, config, "test_resource")
     
-    assert "auto-evolution disabled" in caplog.text
-    mock_destination.alter_table.assert_not_called()
+    assert any(
+        r.levelno == logging.WARNING and "auto-evolution disabled" in r.getMessage()
+        for r in caplog.records
+    )
+    assert dest_stub.alter_calls == []
 
 @pytest.mark.skip(reason="TODO: Implement after TableAutoCreator is available")
 def test_generate_alter_table_postgresql():
@@ -155,15 +176,77 @@ def test_generate_alter_table_snowflake():
     """Test_generate_alter_table_snowflake"""
     pass
 
-def test_on_type_change_fail_raises(schema_v1, schema_v4_type_change, mock_destination):
+def test_on_type_change_fail_raises(schemas, dest_stub):
     """Test_on_type_change_fail_raises"""
     manager = SchemaEvolutionManager()
-    changes = manager.compare_schemas(schema_v1, schema_v4_type_change)
+    changes = manager.compare_schemas(schemas.v1, schemas.type_change)
     # Test with 'auto' mode, which should fail if on_type_change is 'fail'
-    config = SchemaEvolutionConfig(mode="auto", on_type_change="fail")
+    config = SchemaEvolutionConfig(mode="auto", on_type_change="fail", track_history=False)
+    
+    with pytest.raises(SchemaEvolutionError, match="type changed"):
+        manager.apply_evolution(dest_stub, "test_table", changes, config, "test_resource")
+    assert dest_stub.alter_calls == []
+
+def test_on_type_change_warn_logs(schemas, dest_stub, caplog):
+    """Test_on_type_change_warn_logs"""
+    manager = SchemaEvolutionManager()
+    changes = manager.compare_schemas(schemas.v1, schemas.type_change)
+    config = SchemaEvolutionConfig(mode="auto", on_type_change="warn", track_history=False)
+    
+    with caplog.at_level(logging.WARNING, logger="conduit_core.schema_evolution"):
+        ddl = manager.apply_evolution(dest_stub, "test_table", changes, config, "test_resource")
+    
+    assert ddl == []
+    assert any(
+        r.levelno == logging.WARNING and "Type changed" in r.getMessage()
+        for r in caplog.records
+    )
+
+def test_removed_column_warns(schemas, dest_stub, caplog):
+    """Test_removed_column_warns"""
+    manager = SchemaEvolutionManager()
+    changes = manager.compare_schemas(schemas.v1, schemas.removed)
+    config = SchemaEvolutionConfig(mode="auto", on_column_removed="warn", track_history=False)
+    
+    with caplog.at_level(logging.WARNING, logger="conduit_core.schema_evolution"):
+        ddl = manager.apply_evolution(dest_stub, "test_table", changes, config, "test_resource")
+    
+    assert ddl == []
+    assert any(
+        "Source missing columns" in r.getMessage() and "Inserting NULL values" in r.getMessage()
+        for r in caplog.records if r.levelno == logging.WARNING
+    )
+
+@pytest.mark.xfail(reason="on_column_removed=fail not yet implemented")
+def test_removed_column_fails(schemas, dest_stub):
+    """Test_removed_column_fails"""
+    manager = SchemaEvolutionManager()
+    changes = manager.compare_schemas(schemas.v1, schemas.removed)
+    config = SchemaEvolutionConfig(mode="auto", on_column_removed="fail", track_history=False)
+    
+    with pytest.raises(SchemaEvolutionError, match="removed from source"):
+        manager.apply_evolution(dest_stub, "test_table", changes, config, "test_resource")
+
+def test_audit_trail_created(schemas, dest_stub):
+    """Test_audit_trail_created"""
+    manager = SchemaEvolutionManager()
+    changes = manager.compare_schemas(schemas.v1, schemas.added)
+    config = SchemaEvolutionConfig(mode="auto", auto_add_columns=True, track_history=True)
+    
+    with patch('conduit_core.schema_evolution.TableAutoCreator.generate_add_column_sql') as mock_gen, \
+         patch('conduit_core.schema_store.SchemaStore') as mock_store_class:
+        mock_gen.return_value = "ALTER TABLE test_table ADD COLUMN email STRING"
+        mock_store_instance = MagicMock()
+        mock_store_instance.load_last_schema.return_value = {'version': 1, 'schema': schemas.v1}
+        mock_store_instance.log_evolution_event.return_value = Path('.conduit/schema_audit/test_20251026_120000.json')
+        mock_store_class.return_value = mock_store_instance
+        
+        ddl = manager.apply_evolution(dest_stub, "test_table", changes, config, "test_resource")
     
-    with pytest.raises(SchemaEvolutionError, match="type change"):
-        manager.apply_evolution(mock_destination, "test_table", changes, config, "test_resource")
+    assert len(ddl) == 1
+    mock_store_instance.log_evolution_event.assert_called_once()
+    assert mock_store_instance.log_evolution_event.call_args.kwargs['new_version'] == 2
+    assert manager.last_audit_path == mock_store_instance.log_evolution_event.return_value
 
 def test_schema_store_saves_and_loads(tmp_schema_store, schema_v1):
     """Test_schema_store_saves_and_loads"""
@@ -184,10 +267,9 @@ def test_schema_store_saves_and_loads(tmp_schema_store, schema_v1):
     # 4. Check that 'latest' file was created
     latest_path = store.schema_dir / f"{resource_name}_latest.json"
     assert latest_path.exists()
-    with open(latest_path, 'r') as f:
-        data = json.load(f)
-        assert data['schema'] == schema_v1
-        assert "timestamp" in data
+    data = json.loads(latest_path.read_text())
+    assert data == loaded_schema
+    assert "timestamp" in data
 
 def test_schema_history_tracking(tmp_schema_store, schema_v1, schema_v2_added_col):
     """Test_schema_history_tracking"""
@@ -211,7 +293,7 @@ def test_schema_history_tracking(tmp_schema_store, schema_v1, schema_v2_added_co
     assert latest['version'] == 2
 # *** FIX 2: Marked this test as skip ***
 @pytest.mark.skip(reason="Logic for this test lives in engine.py and is not yet implemented")
-def test_no_evolution_when_disabled(schema_v1, schema_v2_added_col, mock_destination, caplog):
+def test_no_evolution_when_disabled(schema_v1, schema_v2_added_col, dest_stub, caplog):
     """Test_no_evolution_when_disabled"""
     # This test logic will be in src/conduit_core/engine.py
     # We are confirming that SchemaEvolutionManager is not called if config is disabled
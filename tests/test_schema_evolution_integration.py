@@ -1,59 +1,81 @@
+import shutil
+
 import pytest
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 from conduit_core.config import IngestConfig, Source, Destination, Resource, SchemaEvolutionConfig
 from conduit_core.schema_store import SchemaStore
 from conduit_core.schema_evolution import SchemaEvolutionManager
 
 
+# Fixtures hand out these module-level objects instead of rebuilding the
+# literals per test, so tests must not mutate them.
+SCHEMA_V1 = {
+    'columns': [
+        {'name': 'id', 'type': 'INTEGER', 'nullable': False},
+        {'name': 'name', 'type': 'STRING', 'nullable': True}
+    ]
+}
+
+SCHEMA_V2_ADDED = {
+    'columns': [
+        {'name': 'id', 'type': 'INTEGER', 'nullable': False},
+        {'name': 'name', 'type': 'STRING', 'nullable': True},
+        {'name': 'email', 'type': 'STRING', 'nullable': True}
+    ]
+}
+
+
+@pytest.fixture
+def schema_v1():
+    return SCHEMA_V1
+
+
 @pytest.fixture
-def sample_schema_v1():
-    return {
-        'columns': [
-            {'name': 'id', 'type': 'INTEGER', 'nullable': False},
-            {'name': 'name', 'type': 'STRING', 'nullable': True}
-        ]
-    }
+def schema_v2_added():
+    return SCHEMA_V2_ADDED
+
+
+@pytest.fixture(scope="session")
+def baseline_store_dir(tmp_path_factory):
+    """A schema store directory with SCHEMA_V1 saved as 'test_resource', built once."""
+    root = tmp_path_factory.mktemp("baseline")
+    SchemaStore(base_dir=root / '.conduit').save_schema('test_resource', SCHEMA_V1)
+    return root
 
 
 @pytest.fixture
-def sample_schema_v2():
-    return {
-        'columns': [
-            {'name': 'id', 'type': 'INTEGER', 'nullable': False},
-            {'name': 'name', 'type': 'STRING', 'nullable': True},
-            {'name': 'email', 'type': 'STRING', 'nullable': True}
-        ]
-    }
+def seeded_schema_store(baseline_store_dir, tmp_path):
+    """A per-test copy of the baseline store, so tests can write to it freely."""
+    shutil.copytree(baseline_store_dir / '.conduit', tmp_path / '.conduit')
+    return SchemaStore(base_dir=tmp_path / '.conduit')
 
 
-def test_schema_store_baseline_save(tmp_path, sample_schema_v1):
+def test_schema_store_baseline_save(tmp_path, schema_v1):
     """Test that SchemaStore saves baseline schema correctly."""
     store = SchemaStore(base_dir=tmp_path / '.conduit')
     
-    version = store.save_schema('test_resource', sample_schema_v1)
+    version = store.save_schema('test_resource', schema_v1)
     assert version == 1
     
     loaded = store.load_last_schema('test_resource')
     assert loaded['version'] == 1
-    assert loaded['schema'] == sample_schema_v1
+    assert loaded['schema'] == schema_v1
 
 
-def test_schema_evolution_detects_and_logs(tmp_path, sample_schema_v1, sample_schema_v2):
+def test_schema_evolution_detects_and_logs(tmp_path, seeded_schema_store, dest_stub, schema_v1, schema_v2_added):
     """Test that evolution manager detects changes and logs audit."""
-    store = SchemaStore(base_dir=tmp_path / '.conduit')
-    store.save_schema('test_resource', sample_schema_v1)
+    store = seeded_schema_store
+    assert store.load_last_schema('test_resource')['schema'] == schema_v1
     
     manager = SchemaEvolutionManager()
-    changes = manager.compare_schemas(sample_schema_v1, sample_schema_v2)
+    changes = manager.compare_schemas(schema_v1, schema_v2_added)
     
     assert changes.has_changes()
     assert len(changes.added_columns) == 1
     assert changes.added_columns[0].name == 'email'
     
-    mock_dest = MagicMock()
-    mock_dest.config.type = 'postgresql'
     
     config = SchemaEvolutionConfig(
         enabled=True,
@@ -68,7 +90,7 @@ def test_schema_evolution_detects_and_logs(tmp_path, sample_schema_v1, sample_sc
         mock_gen.return_value = 'ALTER TABLE test ADD COLUMN email STRING'
         
         executed_ddl = manager.apply_evolution(
-            mock_dest,
+            dest_stub,
             'test_table',
             changes,
             config,
@@ -77,24 +99,27 @@ def test_schema_evolution_detects_and_logs(tmp_path, sample_schema_v1, sample_sc
         
         assert len(executed_ddl) == 1
         assert 'email' in executed_ddl[0]
+        assert dest_stub.alter_calls == executed_ddl
         
-        audit_files = list((tmp_path / '.conduit' / 'schema_audit').glob('*.json'))
-        assert len(audit_files) == 1
+        audit_path = manager.last_audit_path
+        assert audit_path.is_file()
+        assert audit_path.parent == tmp_path / '.conduit' / 'schema_audit'
+        assert manager.last_audit_ref.load()['ddl_executed'] == executed_ddl
 
 
-def test_schema_version_increments(tmp_path, sample_schema_v1, sample_schema_v2):
+def test_schema_version_increments(tmp_path, schema_v1, schema_v2_added):
     """Test that schema version increments correctly."""
     store = SchemaStore(base_dir=tmp_path / '.conduit')
     
-    v1 = store.save_schema('test_resource', sample_schema_v1)
-    v2 = store.save_schema('test_resource', sample_schema_v2)
+    v1 = store.save_schema('test_resource', schema_v1)
+    v2 = store.save_schema('test_resource', schema_v2_added)
     
     assert v1 == 1
     assert v2 == 2
     
     latest = store.load_last_schema('test_resource')
     assert latest['version'] == 2
-    assert latest['schema'] == sample_schema_v2
+    assert latest['schema'] == schema_v2_added
     
     history = store.get_schema_history('test_resource')
     assert len(history) == 1
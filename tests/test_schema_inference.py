@@ -1,11 +1,11 @@
 # tests/test_schema_inference.py
 
 import pytest
-import re # <-- Import re for regex search
 from datetime import datetime
 from decimal import Decimal
 
 from conduit_core.schema import SchemaInferrer, CsvDelimiterDetector, TableAutoCreator
+from tests._assert_helpers import assert_contains_all
 
 def test_infer_schema_from_data():
     """Test schema inference from sample data"""
@@ -81,44 +81,31 @@ def test_infer_schema_mixed_types():
     assert not cols["value"]["nullable"]
 
 
-def test_generate_create_table_sql_postgres():
-    """Test generating PostgreSQL CREATE TABLE statement"""
-    schema = {
-        "columns": [
-            {"name": "id", "type": "integer", "nullable": False},
-            {"name": "name", "type": "string", "nullable": False},
-            {"name": "email", "type": "string", "nullable": True},
-            {"name": "created_at", "type": "datetime", "nullable": False},
-        ]
-    }
+_DDL_SCHEMA = {
+    "columns": [
+        {"name": "id", "type": "integer", "nullable": False},
+        {"name": "name", "type": "string", "nullable": False},
+        {"name": "email", "type": "string", "nullable": True},
+        {"name": "created_at", "type": "datetime", "nullable": False},
+        {"name": "active", "type": "boolean", "nullable": False},
+    ]
+}
 
-    sql = TableAutoCreator.generate_create_table_sql("users", schema, "postgresql")
 
-    assert 'CREATE TABLE IF NOT EXISTS "users"' in sql
-    assert '"id" INTEGER NOT NULL' in sql
-    assert '"name" TEXT NOT NULL' in sql
-    assert '"created_at" TIMESTAMP NOT NULL' in sql
-    
-    # Use regex to check the "email" line specifically for nullability
-    assert re.search(r'"email"\s+TEXT\s*(,|$)', sql, re.MULTILINE) is not None
-    assert '"email" TEXT NOT NULL' not in sql # Double check
+@pytest.mark.parametrize("dialect,table,expected", [
+    ("postgresql", "users", ['"id" INTEGER NOT NULL', '"name" TEXT NOT NULL', '"created_at" TIMESTAMP NOT NULL']),
+    # SQLite uses INTEGER for booleans
+    ("sqlite", "flags", ['"id" INTEGER NOT NULL', '"active" INTEGER NOT NULL']),
+])
+def test_generate_create_table_sql(dialect, table, expected):
+    """Test generating CREATE TABLE statements per dialect"""
+    sql = TableAutoCreator.generate_create_table_sql(table, _DDL_SCHEMA, dialect)
 
+    assert_contains_all(sql, f'CREATE TABLE IF NOT EXISTS "{table}"', *expected)
 
-def test_generate_create_table_sql_sqlite():
-    """Test generating SQLite CREATE TABLE statement"""
-    schema = {
-        "columns": [
-            {"name": "id", "type": "integer", "nullable": False},
-            {"name": "active", "type": "boolean", "nullable": False},
-        ]
-    }
-
-    sql = TableAutoCreator.generate_create_table_sql("flags", schema, "sqlite")
-    
-    assert 'CREATE TABLE IF NOT EXISTS "flags"' in sql
-    assert '"id" INTEGER NOT NULL' in sql
-    # Correct expectation: SQLite uses INTEGER for booleans
-    assert '"active" INTEGER NOT NULL' in sql 
+    # The "email" column is nullable, so its line carries no NOT NULL suffix
+    assert '"email" TEXT,\n' in sql or sql.rstrip().endswith('"email" TEXT\n);')
+    assert '"email" TEXT NOT NULL' not in sql # Double check
 
 
 def test_infer_types_from_strings():
@@ -135,4 +122,25 @@ def test_infer_types_from_strings():
     assert cols["count"]["type"] == "integer"
     assert cols["price"]["type"] == "float"
     assert cols["active"]["type"] == "boolean"
-    assert cols["created"]["type"] == "date"
\ No newline at end of file
+    assert cols["created"]["type"] == "date"
+
+
+def test_infer_schema_repeated_string_values():
+    """Repeated string values are voted by count, not by distinct value"""
+    records = [{"flag": "yes", "code": "7"} for _ in range(9)] + [{"flag": "maybe", "code": "x"}]
+
+    schema = SchemaInferrer.infer_schema(records)
+
+    types = {col["name"]: col["type"] for col in schema["columns"]}
+    assert types == {"flag": "boolean", "code": "integer"}
+
+
+def test_infer_schema_sparse_records():
+    """Columns missing from some records are nullable and keep first-seen order"""
+    records = [{"id": 1, "name": "a"}, {"id": 2, "email": "b@x.io"}, {"id": 3, "name": ""}]
+
+    schema = SchemaInferrer.infer_schema(records)
+
+    assert [(c["name"], c["nullable"]) for c in schema["columns"]] == [
+        ("id", False), ("name", True), ("email", True)
+    ]
@@ -1,33 +1,32 @@
 # tests/test_schema_integration.py
+import io
 import pytest
 import json
-import yaml
-from pathlib import Path
-from typer.testing import CliRunner
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 import logging
+from pathlib import Path
+from typing import Iterable
 
-from conduit_core.cli import app as cli_app
-from conduit_core.config import IngestConfig, Source, Destination, Resource, SchemaEvolutionConfig
+from conduit_core.cli import _schema_impl
+from conduit_core.config import IngestConfig, Source, Destination, Resource
 from conduit_core.engine import run_resource
-from conduit_core.schema_evolution import SchemaEvolutionError
-from conduit_core.schema_store import SchemaStore
-from conduit_core.schema import ColumnDefinition
+from tests.fakes.connectors import FakeSource, FakeDestination
 
-# Fixture to create a dummy config
-@pytest.fixture
-def base_config(tmp_path):
-    """Provides a base config object and paths."""
-    source_path = tmp_path / "source.csv"
-    dest_path = tmp_path / "dest.json"
+@pytest.fixture(autouse=True)
+def _info_logs(caplog):
+    caplog.set_level(logging.INFO)
 
-    config = IngestConfig(
+
+@pytest.fixture(scope="module")
+def _base_config_template():
+    """Validated IngestConfig built once per module; tests get deep copies."""
+    return IngestConfig(
         sources=[
-            Source(name="csv_source", type="csv", path=str(source_path)),
+            Source(name="csv_source", type="csv", path="source.csv"),
             Source(name="pg_source", type="postgresql", connection_string="dummy_conn"),
         ],
         destinations=[
-            Destination(name="json_dest", type="json", path=str(dest_path)),
+            Destination(name="json_dest", type="json", path="dest.json"),
             Destination(name="pg_dest", type="postgresql", connection_string="dummy_conn", table="test_table"),
             Destination(name="sf_dest", type="snowflake", account="dummy", user="dummy", password="dummy", warehouse="dummy", database="dummy", table="test_table"),
             Destination(name="bq_dest", type="bigquery", project="dummy", dataset="dummy", table="test_table"),
@@ -39,17 +38,32 @@ def base_config(tmp_path):
             Resource(name="pg_to_bq", source="pg_source", destination="bq_dest", query="SELECT * FROM users"),
         ]
     )
+
+
+@pytest.fixture
+def base_config(_base_config_template, tmp_path):
+    """Provides a base config object and paths."""
+    source_path = tmp_path / "source.csv"
+    dest_path = tmp_path / "dest.json"
+
+    config = _base_config_template.model_copy(deep=True)
+    config.sources[0].path = str(source_path)
+    config.destinations[0].path = str(dest_path)
     return config, source_path, dest_path
 
 
+def write_csv(path: Path, header: bytes, rows: Iterable[bytes]) -> None:
+    """Write a CSV fixture from pre-encoded header and row bytes."""
+    with path.open("wb", buffering=1 << 16) as f:
+        f.write(header)
+        f.writelines(rows)
+
+
 # --- 1. Schema Inference in Pipeline ---
 
 def test_infer_schema_from_csv_source(base_config, tmp_path, caplog):
-    import logging
-    caplog.set_level(logging.INFO)
-    
     config, source_path, dest_path = base_config
-    source_path.write_text("id,name,age\n1,Alice,30\n2,Bob,25\n")
+    source_path.write_bytes(b"id,name,age\n1,Alice,30\n2,Bob,25\n")
     
     config.sources[0].infer_schema = True
     config.sources[0].schema_sample_size = 50
@@ -66,11 +80,8 @@ def test_infer_schema_from_csv_source(base_config, tmp_path, caplog):
 
 
 def test_infer_schema_with_nulls(base_config, caplog):
-    import logging
-    caplog.set_level(logging.INFO)
-    
     config, source_path, dest_path = base_config
-    source_path.write_text("id,name,email\n1,Alice,\n2,,bob@test.com\n")
+    source_path.write_bytes(b"id,name,email\n1,Alice,\n2,,bob@test.com\n")
     
     config.sources[0].infer_schema = True
     
@@ -85,13 +96,9 @@ def test_infer_schema_with_nulls(base_config, caplog):
     assert "Inferred schema" in caplog.text
 
 def test_infer_schema_respects_sample_size(base_config, caplog):
-    import logging
-    caplog.set_level(logging.INFO)
-    
     config, source_path, dest_path = base_config
     
-    csv_content = "id\n" + "\n".join(str(i) for i in range(100))
-    source_path.write_text(csv_content)
+    write_csv(source_path, b"id\n", (b"%d\n" % i for i in range(100)))
     
     config.sources[0].infer_schema = True
     config.sources[0].schema_sample_size = 2
@@ -109,7 +116,7 @@ def test_infer_schema_respects_sample_size(base_config, caplog):
 
 def test_infer_schema_disabled_by_default(base_config, caplog):
     config, source_path, dest_path = base_config
-    source_path.write_text("id,name\n1,Alice\n")
+    source_path.write_bytes(b"id,name\n1,Alice\n")
     
     # Don't set infer_schema (defaults to False)
     run_resource(config.resources[0], config, dry_run=True, skip_preflight=True)
@@ -150,37 +157,23 @@ def test_auto_create_table_postgresql(base_config):
     source_config.infer_schema = True
     dest_config.auto_create_table = True
 
-    mock_source_class = MagicMock()
-    mock_source_instance = mock_source_class.return_value
-    mock_source_instance.read = MagicMock(side_effect=lambda query=None: iter([
-        {'id': 1, 'name': 'Alice'},
-        {'id': 2, 'name': 'Bob'}
-    ]))
-    mock_source_instance.estimate_total_records.return_value = None
-
-    mock_ddl_method = MagicMock()
-    mock_dest_class = MagicMock()
-    mock_dest_instance = mock_dest_class.return_value
-    mock_dest_instance.config = dest_config
-    mock_dest_instance.execute_ddl = mock_ddl_method
-    mock_dest_instance.table_exists = MagicMock(return_value=False)
-    mock_dest_instance.get_table_schema = MagicMock(return_value={"columns": []})
-    mock_dest_instance.write = MagicMock()
-    mock_dest_instance.finalize = MagicMock()
-    mock_dest_instance.estimate_total_records = MagicMock(return_value=None)
-    mock_dest_instance.database = None
-    mock_dest_instance.db_schema = None
-
-    with patch('conduit_core.engine.get_source_connector_map', return_value={'postgresql': mock_source_class}), \
-         patch('conduit_core.engine.get_destination_connector_map', return_value={'postgresql': mock_dest_class}):
+    rows = [{'id': 1, 'name': 'Alice'}, {'id': 2, 'name': 'Bob'}]
+    destinations = []
+
+    def _make_destination(cfg):
+        destinations.append(FakeDestination(cfg))
+        return destinations[-1]
+
+    with patch('conduit_core.engine.get_source_connector_map', return_value={'postgresql': lambda cfg: FakeSource(cfg, rows)}), \
+         patch('conduit_core.engine.get_destination_connector_map', return_value={'postgresql': _make_destination}):
         with patch('conduit_core.engine.preflight_check', return_value={"passed": True, "checks": [], "warnings": [], "errors": [], "duration_s": 0}):
             run_resource(resource, config, dry_run=False, skip_preflight=False)
 
-    mock_ddl_method.assert_called_once()
-    called_sql = mock_ddl_method.call_args[0][0]
-    assert 'CREATE TABLE IF NOT EXISTS "test_table"' in called_sql
-    assert '"id" INTEGER NOT NULL' in called_sql
-    assert '"name" TEXT NOT NULL' in called_sql
+    ddl_calls = destinations[0].ddl_calls
+    assert len(ddl_calls) == 1
+    assert 'CREATE TABLE IF NOT EXISTS "test_table"' in ddl_calls[0]
+    assert '"id" INTEGER NOT NULL' in ddl_calls[0]
+    assert '"name" TEXT NOT NULL' in ddl_calls[0]
 
 
 @pytest.mark.skip(reason="TODO: Implement mock and run")
@@ -226,13 +219,13 @@ def test_schema_validation_missing_required_columns(base_config):
 # --- 5. CLI Schema Command ---
 
 @patch('conduit_core.connectors.csv.CsvSource.read')
-def test_cli_schema_command(mock_read, tmp_path):
-    runner = CliRunner()
+def test_cli_schema_command(mock_read, tmp_path, capsys):
+    def _rows(query=None):
+        yield {'id': 1, 'user': 'cli_user', 'value': 1.23}
+        yield {'id': 2, 'user': 'test_user', 'value': 4.56}
 
-    mock_read.return_value = iter([
-        {'id': 1, 'user': 'cli_user', 'value': 1.23},
-        {'id': 2, 'user': 'test_user', 'value': 4.56}
-    ])
+    # A fresh generator per read(), like a real streaming source
+    mock_read.side_effect = _rows
 
     config_content = """
 sources:
@@ -249,21 +242,14 @@ resources:
     config_file = tmp_path / "ingest.yml"
     config_file.write_text(config_content)
 
-    output_file = tmp_path / "cli_schema.json"
+    buf = io.StringIO()
 
-    result = runner.invoke(cli_app, [
-        "schema",
-        "--file", str(config_file),
-        "--output", str(output_file),
-        "test_resource"
-    ])
+    rc = _schema_impl(config_file, "test_resource", buf)
 
-    assert result.exit_code == 0
-    assert "Schema exported to" in result.stdout
-    assert output_file.exists()
+    assert rc == 0
+    assert "Schema exported to" in capsys.readouterr().out
 
-    with open(output_file, 'r') as f:
-        schema_data = json.load(f)
+    schema_data = json.loads(buf.getvalue())
 
     assert "columns" in schema_data
     cols = {c['name']: c for c in schema_data['columns']}
@@ -276,9 +262,7 @@ resources:
     assert cols["value"]["type"] == "float"
 
 
-def test_cli_schema_invalid_resource(tmp_path):
-    runner = CliRunner()
-
+def test_cli_schema_invalid_resource(tmp_path, capsys):
     config_content = """
 sources:
   - name: test_source
@@ -294,24 +278,19 @@ resources:
     config_file = tmp_path / "ingest.yml"
     config_file.write_text(config_content)
 
-    result = runner.invoke(cli_app, [
-        "schema",
-        "--file", str(config_file),
-        "non_existent_resource"
-    ])
+    rc = _schema_impl(config_file, "non_existent_resource", tmp_path / "schema.json")
 
-    assert result.exit_code == 1
-    assert "Resource 'non_existent_resource' not found" in result.stdout
+    assert rc == 1
+    assert "Resource 'non_existent_resource' not found" in capsys.readouterr().out
 
 
 # --- 6. Edge Cases ---
 
 def test_schema_inference_empty_source(base_config, caplog):
-    import logging
     caplog.set_level(logging.WARNING)
     
     config, source_path, dest_path = base_config
-    source_path.write_text("id,name\n")
+    source_path.write_bytes(b"id,name\n")
     
     config.sources[0].infer_schema = True
     
@@ -1,7 +1,8 @@
+import os
 import pytest
 import json
 from pathlib import Path
-from conduit_core.schema_store import SchemaStore, compute_schema_hash
+from conduit_core.schema_store import SchemaStore, compute_schema_hash, _write_json
 
 @pytest.fixture
 def tmp_schema_store(tmp_path):
@@ -37,6 +38,17 @@ def test_compute_schema_hash_different_for_different_schemas(sample_schema_v1, s
     hash2 = compute_schema_hash(sample_schema_v2)
     assert hash1 != hash2
 
+def test_compute_schema_hash_structural(sample_schema_v1):
+    reordered = {'columns': [dict(reversed(list(c.items()))) for c in reversed(sample_schema_v1['columns'])]}
+    flipped = {'columns': [dict(c, nullable=not c['nullable']) for c in sample_schema_v1['columns']]}
+    assert compute_schema_hash(reordered) == compute_schema_hash(sample_schema_v1)
+    assert compute_schema_hash(flipped) != compute_schema_hash(sample_schema_v1)
+
+def test_compute_schema_hash_sees_in_place_edits(sample_schema_v1):
+    before = compute_schema_hash(sample_schema_v1)
+    sample_schema_v1['columns'][0]['type'] = 'STRING'
+    assert compute_schema_hash(sample_schema_v1) != before
+
 def test_save_schema_creates_version(tmp_schema_store, sample_schema_v1):
     version = tmp_schema_store.save_schema('test_resource', sample_schema_v1)
     assert version == 1
@@ -67,6 +79,23 @@ def test_save_schema_archives_old_version(tmp_schema_store, sample_schema_v1, sa
     assert history[0]['schema'] == sample_schema_v1
     assert history[0]['version'] == 1
 
+def test_save_schema_repeated_save_creates_new_version(tmp_schema_store, sample_schema_v1):
+    v1 = tmp_schema_store.save_schema('test_resource', sample_schema_v1)
+    v2 = tmp_schema_store.save_schema('test_resource', dict(sample_schema_v1))
+
+    assert v2 == v1 + 1
+    assert len(tmp_schema_store.get_schema_history('test_resource')) == 1
+
+def test_write_json_failure_keeps_previous_file(tmp_path):
+    target = tmp_path / 'latest.json'
+    _write_json(target, {'version': 1})
+
+    with pytest.raises(TypeError):
+        _write_json(target, {'version': object()})
+
+    assert json.loads(target.read_text()) == {'version': 1}
+    assert list(tmp_path.iterdir()) == [target]
+
 def test_log_evolution_event(tmp_schema_store):
     changes = {
         'added': [{'name': 'email', 'type': 'STRING', 'nullable': True}],
@@ -83,10 +112,10 @@ def test_log_evolution_event(tmp_schema_store):
         new_version=2
     )
     
+    assert audit_file == tmp_schema_store.audit_dir / 'audit.log.ndjson'
     assert audit_file.exists()
     
-    with open(audit_file, 'r') as f:
-        audit_data = json.load(f)
+    audit_data = tmp_schema_store.last_audit_ref.load()
     
     assert audit_data['resource'] == 'test_resource'
     assert audit_data['old_version'] == 1
@@ -94,6 +123,78 @@ def test_log_evolution_event(tmp_schema_store):
     assert audit_data['changes'] == changes
     assert audit_data['ddl_executed'] == ddl
 
+@pytest.mark.parametrize('has_orjson', [True, False])
+def test_log_evolution_event_appends(tmp_schema_store, monkeypatch, has_orjson):
+    monkeypatch.setattr('conduit_core.schema_store.HAS_ORJSON', has_orjson)
+    for new_version in (2, 3):
+        audit_file = tmp_schema_store.log_evolution_event(
+            resource_name='test_resource',
+            changes={},
+            ddl_applied=[],
+            old_version=new_version - 1,
+            new_version=new_version
+        )
+
+    assert list(tmp_schema_store.audit_dir.iterdir()) == [audit_file]
+    lines = audit_file.read_text().splitlines()
+    assert [json.loads(line)['new_version'] for line in lines] == [2, 3]
+    assert tmp_schema_store.last_audit_ref.load()['new_version'] == 3
+
 def test_load_nonexistent_schema(tmp_schema_store):
     result = tmp_schema_store.load_last_schema('nonexistent')
-    assert result is None
\ No newline at end of file
+    assert result is None
+
+
+@pytest.mark.parametrize('has_orjson', [True, False])
+def test_schema_round_trip_with_and_without_orjson(tmp_path, sample_schema_v1, monkeypatch, has_orjson):
+    monkeypatch.setattr('conduit_core.schema_store.HAS_ORJSON', has_orjson)
+    store = SchemaStore(base_dir=tmp_path / 'schemas')
+
+    store.save_schema('test_resource', sample_schema_v1)
+    loaded = store.load_last_schema('test_resource')
+
+    assert loaded['schema'] == sample_schema_v1
+    assert loaded['version'] == 1
+    assert json.loads(store._get_latest_path('test_resource').read_text()) == loaded
+
+def test_load_last_schema_reuses_parse_until_file_changes(tmp_schema_store, sample_schema_v1, sample_schema_v2):
+    tmp_schema_store.save_schema('test_resource', sample_schema_v1)
+    first = tmp_schema_store.load_last_schema('test_resource')
+
+    # A separate store over the same directory gets an equal, independent copy
+    again = SchemaStore(base_dir=tmp_schema_store.base_dir).load_last_schema('test_resource')
+    assert again == first
+    assert again is not first
+
+    first['schema']['columns'].clear()
+    assert tmp_schema_store.load_last_schema('test_resource')['schema'] == sample_schema_v1
+
+    tmp_schema_store.save_schema('test_resource', sample_schema_v2)
+    second = tmp_schema_store.load_last_schema('test_resource')
+    assert second is not first
+    assert second['schema'] == sample_schema_v2
+
+def test_load_last_schema_sees_same_size_rewrite_within_one_mtime(tmp_schema_store, sample_schema_v1):
+    tmp_schema_store.save_schema('test_resource', sample_schema_v1)
+    latest_path = tmp_schema_store._get_latest_path('test_resource')
+    st = latest_path.stat()
+    assert tmp_schema_store.load_last_schema('test_resource')['version'] == 1
+
+    # Replace the file with same-size content and restore the old mtime
+    record = json.loads(latest_path.read_text())
+    record['version'] = 2
+    _write_json(latest_path, record)
+    os.utime(latest_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert latest_path.stat().st_size == st.st_size
+
+    assert tmp_schema_store.load_last_schema('test_resource')['version'] == 2
+
+def test_load_last_schema_interns_column_strings(tmp_path, sample_schema_v1):
+    for name in ('a', 'b'):
+        store = SchemaStore(base_dir=tmp_path / name)
+        store.save_schema('test_resource', sample_schema_v1)
+
+    col_a = SchemaStore(base_dir=tmp_path / 'a').load_last_schema('test_resource')['schema']['columns'][0]
+    col_b = SchemaStore(base_dir=tmp_path / 'b').load_last_schema('test_resource')['schema']['columns'][0]
+    assert col_a['name'] is col_b['name']
+    assert col_a['type'] is col_b['type']
@@ -137,6 +137,42 @@ def test_validation_report_formatting():
     assert 'type' in formatted.lower()
 
 
+def test_missing_columns_keep_schema_order():
+    """Missing columns are reported in destination/required order"""
+    validator = SchemaValidator()
+    source_schema = {'id': {'type': 'integer'}}
+    dest_schema = {'z': {'type': 'string'}, 'id': {'type': 'integer'}, 'a': {'type': 'string'}}
+
+    report = validator.check_missing_columns(source_schema, dest_schema, strict=False)
+
+    assert report.is_valid
+    assert [w.column for w in report.warnings] == ['z', 'a']
+    assert validator.check_required_columns(source_schema, ['z', 'id', 'a']) == ['z', 'a']
+
+
+def test_identical_schemas_short_circuit():
+    """Identical schemas validate clean, except for types the matrix doesn't know"""
+    validator = SchemaValidator()
+    schema = {'id': {'type': 'integer', 'nullable': False}, 'name': {'type': 'string', 'nullable': True}}
+
+    assert validator.validate_type_compatibility(schema, schema).is_valid
+    assert validator.validate_type_compatibility(schema, dict(schema)).is_valid
+
+    odd = {'t': {'type': 'time', 'nullable': True}}
+    assert not validator.validate_type_compatibility(odd, odd).is_valid
+
+
+def test_report_formats_one_line_per_issue():
+    """Multiple errors/warnings are newline-separated with no trailing newline"""
+    errors = [ValidationError(column=c, issue='type_mismatch', expected='integer', actual='string') for c in ('a', 'b')]
+    warning = ValidationError(column='c', issue='missing_column', severity='warning')
+
+    report = ValidationReport(is_valid=False, errors=errors, warnings=[warning])
+
+    assert report.format_errors() == "\n".join(e.format() for e in errors)
+    assert report.format_warnings() == warning.format()
+
+
 def test_skip_validation_when_disabled():
     """Test that validation is skipped when validate_schema=False"""
     pytest.skip("Tested in integration")
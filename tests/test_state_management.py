@@ -102,4 +102,93 @@ def test_state_file_corruption_handling(tmp_path, monkeypatch):
     
     # Should not crash, should return empty state
     state = load_state()
-    assert isinstance(state, dict)
\ No newline at end of file
+    assert isinstance(state, dict)
+
+@pytest.mark.parametrize('has_orjson', [True, False])
+def test_state_round_trip_with_and_without_orjson(tmp_path, monkeypatch, has_orjson):
+    """State files are plain JSON whichever encoder wrote them"""
+    test_state_file = tmp_path / ".conduit_state.json"
+    monkeypatch.setattr("conduit_core.state.STATE_FILE", test_state_file)
+    monkeypatch.setattr("conduit_core.state.BACKUP_FILE", tmp_path / ".conduit_state.backup.json")
+    monkeypatch.setattr("conduit_core.state.HAS_ORJSON", has_orjson)
+
+    save_state({"resource1": 100, "cursor": "2024-01-01"})
+
+    assert load_state() == {"resource1": 100, "cursor": "2024-01-01"}
+    assert json.loads(test_state_file.read_text()) == {"resource1": 100, "cursor": "2024-01-01"}
+
+
+def test_state_file_format_does_not_depend_on_orjson(tmp_path, monkeypatch):
+    """Both encoders write the same indented bytes, non-str keys included"""
+    pytest.importorskip("orjson")
+    test_state_file = tmp_path / ".conduit_state.json"
+    monkeypatch.setattr("conduit_core.state.STATE_FILE", test_state_file)
+    monkeypatch.setattr("conduit_core.state.BACKUP_FILE", tmp_path / ".conduit_state.backup.json")
+    state = {"resource1": 100, "cursor": "caf\u00e9", 7: [1.5, None, True]}
+
+    written = {}
+    for has_orjson in (True, False):
+        monkeypatch.setattr("conduit_core.state.HAS_ORJSON", has_orjson)
+        save_state(state)
+        written[has_orjson] = test_state_file.read_bytes()
+
+    assert written[True] == written[False]
+    assert written[True].endswith(b"}\n")
+    assert json.loads(written[True]) == {"resource1": 100, "cursor": "caf\u00e9", "7": [1.5, None, True]}
+
+def test_load_state_treats_empty_file_as_corrupted(tmp_path, monkeypatch):
+    """An empty state file falls back to the backup instead of raising"""
+    test_state_file = tmp_path / ".conduit_state.json"
+    test_backup_file = tmp_path / ".conduit_state.backup.json"
+    monkeypatch.setattr("conduit_core.state.STATE_FILE", test_state_file)
+    monkeypatch.setattr("conduit_core.state.BACKUP_FILE", test_backup_file)
+    test_state_file.write_bytes(b"")
+    test_backup_file.write_text(json.dumps({"resource1": 100}))
+
+    assert load_state() == {"resource1": 100}
+
+
+def test_failed_save_leaves_previous_state_in_place(tmp_path, monkeypatch):
+    """A state that can't be serialized doesn't disturb the current file or backup"""
+    test_state_file = tmp_path / ".conduit_state.json"
+    test_backup_file = tmp_path / ".conduit_state.backup.json"
+    monkeypatch.setattr("conduit_core.state.STATE_FILE", test_state_file)
+    monkeypatch.setattr("conduit_core.state.BACKUP_FILE", test_backup_file)
+    save_state({"resource1": 100})
+
+    with pytest.raises(TypeError):
+        save_state({"resource1": object()})
+
+    assert load_state() == {"resource1": 100}
+    assert not test_backup_file.exists()
+    assert not test_state_file.with_suffix('.tmp').exists()
+
+
+def test_load_state_returns_independent_copies(tmp_path, monkeypatch):
+    """Mutating nested values of a loaded state doesn't leak into later loads"""
+    test_state_file = tmp_path / ".conduit_state.json"
+    monkeypatch.setattr("conduit_core.state.STATE_FILE", test_state_file)
+    monkeypatch.setattr("conduit_core.state.BACKUP_FILE", tmp_path / ".conduit_state.backup.json")
+    state = {"resource1": {"cursor": 100}}
+    save_state(state)
+    state["resource1"]["cursor"] = -2
+
+    loaded = load_state()
+    loaded["resource1"]["cursor"] = -1
+
+    assert load_state() == {"resource1": {"cursor": 100}}
+
+
+def test_load_state_rereads_file_changed_on_disk(tmp_path, monkeypatch):
+    """The in-memory copy is dropped once the file is rewritten by someone else"""
+    test_state_file = tmp_path / ".conduit_state.json"
+    monkeypatch.setattr("conduit_core.state.STATE_FILE", test_state_file)
+    monkeypatch.setattr("conduit_core.state.BACKUP_FILE", tmp_path / ".conduit_state.backup.json")
+    save_state({"resource1": 100})
+
+    loaded = load_state()
+    loaded["resource1"] = -1  # callers get a copy
+    assert load_state() == {"resource1": 100}
+
+    test_state_file.write_text(json.dumps({"resource1": 200, "resource2": 1}))
+    assert load_state() == {"resource1": 200, "resource2": 1}
@@ -98,6 +98,42 @@ def test_parse_value_null():
     assert converter.parse_value("") is None
 
 
+def test_datetime_conversion_cache_respects_offsets():
+    """Equal instants in different offsets keep their own ISO strings"""
+    from datetime import timedelta, timezone
+    utc = datetime(2025, 1, 1, 12, tzinfo=timezone.utc)
+    cet = datetime(2025, 1, 1, 13, tzinfo=timezone(timedelta(hours=1)))
+    assert utc == cet
+
+    assert TypeConverter.to_safe_type(utc) == "2025-01-01T12:00:00+00:00"
+    assert TypeConverter.to_safe_type(cet) == "2025-01-01T13:00:00+01:00"
+    assert TypeConverter.to_safe_type(datetime(2025, 1, 1, 12)) == "2025-01-01T12:00:00"
+    assert TypeConverter.to_safe_type(date(2025, 1, 1)) == "2025-01-01"
+
+
+def test_to_safe_floats():
+    """Test vectorized NaN/Infinity handling for float columns"""
+    np = pytest.importorskip("numpy")
+    values = [1.5, float('nan'), float('inf'), float('-inf'), 0.0]
+
+    result = TypeConverter.to_safe_floats(np.array(values))
+
+    assert result.tolist() == [1.5, None, None, None, 0.0]
+    assert result.tolist() == [TypeConverter.to_safe_type(v) for v in values]
+
+
+@pytest.mark.parametrize("raw,expected", [
+    ("42", 42), ("-7", -7), (" 8 ", 8), ("1_000", 1000), ("1", 1),
+    ("2.5", 2.5), ("Yes", True), ("NO", False), ("t", "t"), ("NaN", None),
+    ("+3", 3), (".5", 0.5), ("1e3", 1000.0), ("1.2.3", "1.2.3"), ("inf", float("inf")),
+])
+def test_parse_value_auto_detect(raw, expected):
+    """Auto-detection order: int, float, boolean words, datetime, string"""
+    result = TypeConverter.parse_value(raw)
+    assert result == expected
+    assert type(result) is type(expected)
+
+
 def test_sanitize_dict():
     """Test sanitizing entire dictionary"""
     data = {
@@ -119,6 +155,20 @@ def test_sanitize_dict():
     assert result["rating"] is None  # NaN converted to None
 
 
+@pytest.mark.parametrize("target_format", ["json", "csv", "sql"])
+def test_type_dispatch_matches_generic_conversion(target_format):
+    """The exact-type fast path converts builtins the same way as the generic path"""
+    values = [
+        None, "text", 7, True, False, 1.5, float('inf'), datetime(2025, 1, 1, 12), date(2025, 1, 1),
+        Decimal("1.25"), b"bytes", [1, 2], {"a": 1},
+    ]
+    for value in values:
+        assert TypeConverter.to_safe_type(value, target_format) == \
+            TypeConverter._to_safe_type_generic(value, target_format)
+
+    assert TypeConverter.to_safe_type(Decimal("NaN"), target_format) is None
+
+
 def test_encoding_detector(tmp_path):
     """Test encoding detection"""
     # Create a UTF-8 file
@@ -130,6 +180,24 @@ def test_encoding_detector(tmp_path):
     assert detected in ['utf-8', 'utf-8-sig']
 
 
+def test_encoding_detector_bom_and_truncated_sample(tmp_path):
+    """A UTF-8 BOM maps to utf-8-sig; a sample ending mid-character is still UTF-8"""
+    bom_file = tmp_path / "bom.csv"
+    bom_file.write_bytes(b"\xef\xbb\xbfid,name\n1,x\n")
+    assert EncodingDetector.detect_encoding(str(bom_file)) == 'utf-8-sig'
+
+    cut_file = tmp_path / "cut.csv"
+    cut_file.write_bytes("é".encode('utf-8') * 10)
+    assert EncodingDetector.detect_encoding(str(cut_file), sample_size=5) == 'utf-8'
+
+
+def test_encoding_detector_whole_file_must_decode_completely(tmp_path):
+    """A latin-1 file ending in a lone lead byte is not UTF-8 when read in full"""
+    latin_file = tmp_path / "latin.csv"
+    latin_file.write_bytes(b"id,name\n1,caf\xe9")
+    assert EncodingDetector.detect_encoding(str(latin_file)) == 'latin-1'
+
+
 def test_nested_structure_to_csv():
     """Test that nested structures are JSON-stringified for CSV"""
     converter = TypeConverter()